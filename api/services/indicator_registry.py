@@ -168,11 +168,19 @@ def register_extended_indicators():
     """Register all extended indicators into the rule engine's INDICATOR_GROUPS.
 
     Call this at startup so validate_rule() and resolve_column_name() work
-    for extended indicators too.
+    for extended indicators too. Clears the rule engine's memoized range and
+    reachability lookups, which may have been computed before registration.
     """
-    from src.signals.rule_engine import INDICATOR_GROUPS
+    from src.signals.rule_engine import (
+        INDICATOR_GROUPS,
+        _check_reachability_cached,
+        _get_field_range,
+    )
 
     for group_name, meta in EXTENDED_INDICATORS.items():
         if group_name not in INDICATOR_GROUPS:
             INDICATOR_GROUPS[group_name] = meta
             logger.info("Registered extended indicator: %s", group_name)
+
+    _get_field_range.cache_clear()
+    _check_reachability_cached.cache_clear()
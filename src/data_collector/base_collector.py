@@ -1,35 +1,72 @@
 """数据采集器基类"""
+import random
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 import pandas as pd
 
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 日线数据的列类型：代码和日期在全市场数据里大量重复，统一用 Arrow 字符串存储；
+# 价格列保持 float64（TA-Lib 只接受 double 数组）
+_DAILY_DTYPES = {
+    "ts_code": "string[pyarrow]",
+    "trade_date": "string[pyarrow]",
+}
+
 
 class CollectorError(Exception):
-    """数据采集相关错误"""
-    pass
+    """数据采集相关错误
+
+    Attributes:
+        retry_after: 数据源被限流时建议的等待时间(秒)，未知时为 None
+    """
+
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class BaseCollector(ABC):
     """数据采集器抽象基类
 
     定义统一的数据采集接口，所有具体采集器（TuShare、AkShare等）需实现此接口。
-    包含自动重试机制。
+    包含自动重试机制（指数退避 + 全抖动）。
     """
 
-    def __init__(self, max_retries: int = 3, retry_delay: float = 1.0):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        max_backoff: float = 30.0,
+        stock_list_ttl: float = 6 * 3600,
+    ):
         """初始化采集器
 
         Args:
             max_retries: 最大重试次数
-            retry_delay: 重试间隔(秒)
+            retry_delay: 退避基准间隔(秒)，第N次失败后的等待上限为 retry_delay * 2^(N-1)
+            max_backoff: 单次退避等待的上限(秒)
+            stock_list_ttl: 股票列表在进程内的缓存时间(秒)，0 表示不缓存
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_backoff = max_backoff
+        self.stock_list_ttl = stock_list_ttl
+        self._stock_list_cache: Optional[pd.DataFrame] = None
+        self._stock_list_cache_expiry = 0.0
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """第 attempt 次失败后的等待时间
+
+        全抖动：在 [0, min(max_backoff, retry_delay * 2^(attempt-1))] 内均匀取值，
+        避免大量请求同时失败后又同时重试。
+        """
+        cap = min(self.max_backoff, self.retry_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)
 
     def _retry(self, func, *args, **kwargs):
         """带重试的函数调用
@@ -54,19 +91,33 @@ class BaseCollector(ABC):
                     f"采集失败 (尝试 {attempt}/{self.max_retries}): {e}"
                 )
                 if attempt < self.max_retries:
-                    time.sleep(self.retry_delay)
+                    time.sleep(self._backoff_delay(attempt))
 
-        raise CollectorError(f"采集失败，已重试{self.max_retries}次: {last_error}")
+        raise CollectorError(
+            f"采集失败，已重试{self.max_retries}次: {last_error}",
+            retry_after=getattr(last_error, "retry_after", None),
+        )
 
     # ===== Public Interface =====
 
     def get_stock_list(self) -> pd.DataFrame:
         """获取A股股票列表
 
+        股票列表一天内最多变化一次，结果在 stock_list_ttl 内复用，不再重复请求数据源。
+
         Returns:
             包含ts_code, name, industry等字段的DataFrame
         """
-        return self._retry(self._fetch_stock_list)
+        if (
+            self._stock_list_cache is not None
+            and time.monotonic() < self._stock_list_cache_expiry
+        ):
+            return self._stock_list_cache.copy()
+
+        df = self._retry(self._fetch_stock_list)
+        self._stock_list_cache = df
+        self._stock_list_cache_expiry = time.monotonic() + self.stock_list_ttl
+        return df.copy()
 
     def get_daily(
         self,
@@ -84,7 +135,41 @@ class BaseCollector(ABC):
         Returns:
             日线数据DataFrame
         """
-        return self._retry(self._fetch_daily, ts_code, start_date, end_date)
+        return self._cast_daily(
+            self._retry(self._fetch_daily, ts_code, start_date, end_date)
+        )
+
+    def get_daily_batch(
+        self,
+        ts_codes: Iterable[str],
+        start_date: str,
+        end_date: str,
+        max_workers: int = 16,
+    ) -> pd.DataFrame:
+        """并发获取多只股票的日线数据
+
+        请求以 I/O 等待为主，用线程池并发发出，最多 max_workers 个同时进行；
+        每只股票仍走 get_daily 的重试逻辑，任一股票最终失败则抛出其异常。
+
+        Args:
+            ts_codes: 股票代码列表
+            start_date: 开始日期 (YYYYMMDD)
+            end_date: 结束日期 (YYYYMMDD)
+            max_workers: 最大并发请求数
+
+        Returns:
+            按 ts_codes 顺序拼接的日线数据
+        """
+        ts_codes = list(ts_codes)
+        if not ts_codes:
+            return pd.DataFrame()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ts_codes))) as executor:
+            frames = list(executor.map(
+                lambda code: self.get_daily(code, start_date, end_date), ts_codes
+            ))
+
+        return pd.concat(frames, ignore_index=True)
 
     def get_daily_all(
         self,
@@ -98,7 +183,13 @@ class BaseCollector(ABC):
         Returns:
             全市场日线数据
         """
-        return self._retry(self._fetch_daily_all, trade_date)
+        return self._cast_daily(self._retry(self._fetch_daily_all, trade_date))
+
+    @staticmethod
+    def _cast_daily(df: pd.DataFrame) -> pd.DataFrame:
+        """把日线数据转换为统一的列类型（只处理存在的列）"""
+        dtypes = {col: dtype for col, dtype in _DAILY_DTYPES.items() if col in df.columns}
+        return df.astype(dtypes) if dtypes else df
 
     def get_index_daily(
         self,
@@ -1,5 +1,9 @@
 """数据采集器管理器，处理多源切换和容灾"""
-from typing import List, Optional
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional
 import pandas as pd
 
 from src.data_collector.base_collector import BaseCollector, CollectorError
@@ -13,22 +17,31 @@ class CollectorManager:
 
     管理多个数据源，实现自动容灾切换。
     优先使用主数据源，失败时依次尝试备用源。
+    主数据源被限流且建议等待时间较短时，先等待后重试一次主数据源。
     """
 
     def __init__(
         self,
         primary: BaseCollector,
-        fallbacks: Optional[List[BaseCollector]] = None
+        fallbacks: Optional[List[BaseCollector]] = None,
+        max_retry_after: float = 2.0,
     ):
         """初始化管理器
 
         Args:
             primary: 主数据源
             fallbacks: 备用数据源列表
+            max_retry_after: 主数据源限流时愿意等待的最长时间(秒)，超过则直接切换备用源。
+                按日期的并发请求会一起等待，默认只等很短的限流；要等待 TuShare
+                按分钟限流的窗口（最长 60 秒）需显式调大
         """
         self.primary = primary
         self.fallbacks = fallbacks or []
+        self.max_retry_after = max_retry_after
         self._all_sources = [primary] + self.fallbacks
+        # 进行中的按日期请求：(方法名, 参数) -> Future，并发的相同请求共享一次上游调用
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def _try_sources(self, method_name: str, *args, **kwargs) -> pd.DataFrame:
         """尝试从多个数据源获取数据
@@ -50,22 +63,61 @@ class CollectorManager:
             try:
                 method = getattr(source, method_name)
                 result = method(*args, **kwargs)
-
-                if i > 0:
-                    logger.info(f"使用备用数据源 {source_name} 成功")
-
-                return result
-
             except (CollectorError, Exception) as e:
-                errors.append(f"{source_name}: {e}")
-                logger.warning(f"数据源 {source_name} 失败: {e}")
-                continue
+                retry_after = getattr(e, "retry_after", None)
+                if i > 0 or retry_after is None or retry_after > self.max_retry_after:
+                    errors.append(f"{source_name}: {e}")
+                    logger.warning(f"数据源 {source_name} 失败: {e}")
+                    continue
+
+                # 主数据源短暂限流：等待建议时间（加少量抖动）后再试一次
+                logger.warning(f"数据源 {source_name} 被限流，{retry_after:.2f}秒后重试: {e}")
+                time.sleep(retry_after + random.uniform(0, 0.25))
+                try:
+                    result = method(*args, **kwargs)
+                except (CollectorError, Exception) as e:
+                    errors.append(f"{source_name}: {e}")
+                    logger.warning(f"数据源 {source_name} 失败: {e}")
+                    continue
+
+            if i > 0:
+                logger.info(f"使用备用数据源 {source_name} 成功")
+
+            return result
 
         # 所有数据源都失败
         error_msg = "所有数据源都失败:\n" + "\n".join(errors)
         logger.error(error_msg)
         raise CollectorError(error_msg)
 
+    def _single_flight(self, method_name: str, *args) -> pd.DataFrame:
+        """合并并发的相同请求
+
+        第一个调用者实际请求数据源，同时到达的相同请求等待其结果，
+        拿到各自的副本（失败时抛出同一异常）。
+        """
+        key = (method_name, *args)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight[key] = Future()
+
+        if not is_leader:
+            return future.result().copy()
+
+        try:
+            result = self._try_sources(method_name, *args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
     def get_stock_list(self) -> pd.DataFrame:
         """获取A股股票列表"""
         return self._try_sources("get_stock_list")
@@ -81,7 +133,7 @@ class CollectorManager:
 
     def get_daily_all(self, trade_date: str) -> pd.DataFrame:
         """获取指定交易日全市场日线数据"""
-        return self._try_sources("get_daily_all", trade_date)
+        return self._single_flight("get_daily_all", trade_date)
 
     def get_index_daily(
         self,
@@ -90,11 +142,11 @@ class CollectorManager:
         end_date: str
     ) -> pd.DataFrame:
         """获取指数日线数据"""
-        return self._try_sources("get_index_daily", ts_code, start_date, end_date)
+        return self._single_flight("get_index_daily", ts_code, start_date, end_date)
 
     def get_money_flow(self, trade_date: str) -> pd.DataFrame:
         """获取资金流数据"""
-        return self._try_sources("get_money_flow", trade_date)
+        return self._single_flight("get_money_flow", trade_date)
 
 
 def create_collector_manager(config) -> CollectorManager:
@@ -115,6 +167,11 @@ def create_collector_manager(config) -> CollectorManager:
     primary = TuShareCollector(
         token=token,
         request_interval=config.get("collector.request_interval", 0.3),
+        rate_per_minute=config.get("tushare.rate_per_minute"),
     )
 
-    return CollectorManager(primary=primary, fallbacks=[])
+    return CollectorManager(
+        primary=primary,
+        fallbacks=[],
+        max_retry_after=config.get("collector.max_retry_after", 2.0),
+    )
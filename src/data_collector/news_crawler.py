@@ -5,9 +5,13 @@
 """
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
+
+import numpy as np
 
 # 导入前清理代理
 for _var in ['HTTP_PROXY', 'http_proxy', 'HTTPS_PROXY', 'https_proxy', 'ALL_PROXY', 'all_proxy']:
@@ -26,6 +30,11 @@ from src.services.api_guard import get_api_guard
 logger = get_logger(__name__)
 
 
+def _keyword_prefixes(keywords: Sequence[str]) -> dict:
+    """关键词 -> 它本身及同为关键词的所有前缀（在同一位置会一起出现）"""
+    return {kw: frozenset(p for p in keywords if kw.startswith(p)) for kw in keywords}
+
+
 @dataclass
 class NewsItem:
     """新闻条目"""
@@ -64,6 +73,19 @@ class NewsCrawler:
         "亏损", "下滑", "低迷", "警示", "退市",
     ]
 
+    # 所有关键词按长度从长到短合成一个预编译正则，一次扫描即可找出文本中出现的关键词
+    _KEYWORD_PATTERN = re.compile("|".join(
+        map(re.escape, sorted(POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS, key=len, reverse=True))
+    ))
+    _KEYWORD_PREFIXES = _keyword_prefixes(POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS)
+    _POSITIVE_SET = frozenset(POSITIVE_KEYWORDS)
+    _NEGATIVE_SET = frozenset(NEGATIVE_KEYWORDS)
+
+    # 关键词情绪打分：基准分，每个命中的正面关键词加分、负面关键词减分
+    NEUTRAL_SCORE = 50.0
+    POSITIVE_WEIGHT = 8
+    NEGATIVE_WEIGHT = 10
+
     def __init__(self, timeout: int = 10):
         """初始化
 
@@ -98,12 +120,9 @@ class NewsCrawler:
 
             news_list = []
             rows = df.head(max_count) if max_count > 0 else df
-            for _, row in rows.iterrows():
-                title = str(row.get('标题', ''))
-                content = str(row.get('内容', ''))
-                pub_date = str(row.get('发布日期', ''))
-                pub_time = str(row.get('发布时间', ''))
-
+            for title, content, pub_date, pub_time in zip(
+                *self._str_columns(rows, '标题', '内容', '发布日期', '发布时间')
+            ):
                 if not title or len(title) < 5:
                     continue
 
@@ -158,12 +177,9 @@ class NewsCrawler:
 
             news_list = []
             rows = df.head(max_count) if max_count > 0 else df
-            for _, row in rows.iterrows():
-                title = str(row.get('标题', ''))
-                summary = str(row.get('摘要', ''))
-                pub_time = str(row.get('发布时间', ''))
-                url = str(row.get('链接', ''))
-
+            for title, summary, pub_time, url in zip(
+                *self._str_columns(rows, '标题', '摘要', '发布时间', '链接')
+            ):
                 if not title or len(title) < 5:
                     continue
 
@@ -214,10 +230,7 @@ class NewsCrawler:
 
             news_list = []
             rows = df.head(max_count) if max_count > 0 else df
-            for _, row in rows.iterrows():
-                content = str(row.get('内容', ''))
-                pub_time = str(row.get('时间', ''))
-
+            for content, pub_time in zip(*self._str_columns(rows, '内容', '时间')):
                 if not content or len(content) < 10:
                     continue
 
@@ -252,16 +265,14 @@ class NewsCrawler:
         Returns:
             合并后的新闻列表
         """
-        all_news = []
-
-        # 财联社
-        all_news.extend(self.fetch_cls_news(max_count))
-
-        # 东方财富
-        all_news.extend(self.fetch_eastmoney_news(max_count))
-
-        # 新浪财经
-        all_news.extend(self.fetch_sina_news(max_count))
+        # 财联社、东方财富、新浪财经 三个数据源互不依赖，并发获取，
+        # 总耗时取决于最慢的数据源；结果仍按固定顺序合并
+        fetchers = [self.fetch_cls_news, self.fetch_eastmoney_news, self.fetch_sina_news]
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = [executor.submit(fetch, max_count) for fetch in fetchers]
+            all_news = []
+            for future in futures:
+                all_news.extend(future.result())
 
         # 去重（基于标题前30字符）
         seen = set()
@@ -275,6 +286,17 @@ class NewsCrawler:
         logger.info(f"共获取 {len(unique_news)} 条新闻（去重后）")
         return unique_news
 
+    @staticmethod
+    def _str_columns(df, *names: str) -> List[List[str]]:
+        """按列取出字符串值，缺失的列返回空字符串
+
+        按列整体转换再 zip 遍历，避免 iterrows 为每一行构造 Series。
+        """
+        return [
+            [str(v) for v in df[name].tolist()] if name in df.columns else [''] * len(df)
+            for name in names
+        ]
+
     # 保留旧方法名以兼容
     def crawl_eastmoney(self, max_count: int = 0) -> List[NewsItem]:
         """兼容旧接口"""
@@ -299,19 +321,44 @@ class NewsCrawler:
         Returns:
             情绪分数 (0-100, 50为中性)
         """
-        positive_count = sum(1 for kw in self.POSITIVE_KEYWORDS if kw in text)
-        negative_count = sum(1 for kw in self.NEGATIVE_KEYWORDS if kw in text)
+        found = self._find_keywords(text)
+        positive_count = len(found & self._POSITIVE_SET)
+        negative_count = len(found & self._NEGATIVE_SET)
 
-        # 基准分50
-        score = 50.0
-
-        # 正面关键词加分，负面减分
-        score += positive_count * 8
-        score -= negative_count * 10
+        score = (
+            self.NEUTRAL_SCORE
+            + positive_count * self.POSITIVE_WEIGHT
+            - negative_count * self.NEGATIVE_WEIGHT
+        )
 
         # 限制在0-100范围
         return max(0, min(100, score))
 
+    def analyze_sentiments(self, texts: Sequence[str]) -> np.ndarray:
+        """批量分析文本情绪
+
+        逐条统计正负关键词数量后，用向量运算一次算出全部分数，
+        结果与逐条调用 analyze_sentiment 一致。
+
+        Args:
+            texts: 新闻标题或内容列表
+
+        Returns:
+            情绪分数数组 (0-100, 50为中性)，顺序与输入一致
+        """
+        counts = np.zeros((len(texts), 2), dtype=np.int64)
+        for i, text in enumerate(texts):
+            found = self._find_keywords(text)
+            counts[i, 0] = len(found & self._POSITIVE_SET)
+            counts[i, 1] = len(found & self._NEGATIVE_SET)
+
+        scores = (
+            self.NEUTRAL_SCORE
+            + counts[:, 0] * self.POSITIVE_WEIGHT
+            - counts[:, 1] * self.NEGATIVE_WEIGHT
+        )
+        return np.clip(scores, 0, 100)
+
     def _extract_keywords(self, text: str) -> str:
         """提取关键词
 
@@ -321,14 +368,34 @@ class NewsCrawler:
         Returns:
             逗号分隔的关键词
         """
-        keywords = []
-
-        for kw in self.POSITIVE_KEYWORDS + self.NEGATIVE_KEYWORDS:
-            if kw in text:
-                keywords.append(kw)
+        found = self._find_keywords(text)
+        keywords = [
+            kw for kw in self.POSITIVE_KEYWORDS + self.NEGATIVE_KEYWORDS if kw in found
+        ]
 
         return ",".join(keywords[:5])  # 最多5个关键词
 
+    def _find_keywords(self, text: str) -> set:
+        """找出文本中出现过的所有情绪关键词
+
+        每次命中后从命中位置的下一个字符继续搜索，因此首尾相叠的关键词
+        （如"大跌停"中的"大跌"和"跌停"）都会被找到。正则在同一位置只返回
+        一个分支，按长度从长到短排列后命中的是该位置最长的关键词，同一位置的
+        其他关键词都是它的前缀，一并加入，结果与逐个 `kw in text` 一致。
+
+        Args:
+            text: 文本
+
+        Returns:
+            命中的关键词集合
+        """
+        found = set()
+        match = self._KEYWORD_PATTERN.search(text)
+        while match:
+            found |= self._KEYWORD_PREFIXES[match.group()]
+            match = self._KEYWORD_PATTERN.search(text, match.start() + 1)
+        return found
+
     def get_overall_sentiment(self, news_list: List[NewsItem]) -> float:
         """计算整体市场情绪
 
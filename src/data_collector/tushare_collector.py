@@ -3,15 +3,22 @@
 数据获取时自动绕过系统代理，直连国内数据源。
 """
 import time
+from typing import Optional
+
 import pandas as pd
 import tushare as ts
 
-from src.data_collector.base_collector import BaseCollector
+from src.data_collector.base_collector import BaseCollector, CollectorError
 from src.utils.logger import get_logger
 from src.utils.network import no_proxy
+from src.utils.rate_limiter import TokenBucket
 
 logger = get_logger(__name__)
 
+# TuShare 超过接口频次时的报错关键字（如 "抱歉，您每分钟最多访问该接口500次"）
+# 及对应的计数窗口长度(秒)
+_RATE_LIMIT_WINDOWS = {"每分钟最多访问": 60.0, "每小时最多访问": 3600.0}
+
 
 class TuShareCollector(BaseCollector):
     """TuShare数据采集器
@@ -27,21 +34,56 @@ class TuShareCollector(BaseCollector):
         token: str,
         request_interval: float = 0.3,
         max_retries: int = 3,
+        rate_per_minute: Optional[float] = None,
     ):
         """初始化TuShare采集器
 
         Args:
             token: TuShare Pro API token
-            request_interval: 请求间隔(秒)，避免频率限制
+            request_interval: 请求间隔(秒)，避免频率限制；<= 0 表示不限速
             max_retries: 最大重试次数
+            rate_per_minute: 每分钟最多请求次数（对应账号积分的接口频次），
+                设置后优先于 request_interval
         """
         super().__init__(max_retries=max_retries)
         self.request_interval = request_interval
         self._api = ts.pro_api(token)
+        # 所有线程共享的令牌桶，保证并发请求时总频次不超限
+        self._limiter: Optional[TokenBucket] = None
+        if rate_per_minute:
+            self._limiter = TokenBucket(rate_per_minute / 60)
+        elif request_interval > 0:
+            self._limiter = TokenBucket(1 / request_interval)
 
     def _rate_limit(self):
         """请求频率限制"""
-        time.sleep(self.request_interval)
+        if self._limiter is not None:
+            self._limiter.acquire()
+
+    @staticmethod
+    def _rate_limit_retry_after(message: str) -> Optional[float]:
+        """从 TuShare 限流报错估算需要等待的秒数
+
+        报错里不带等待时间，按自然分钟/小时计数窗口估算到下一个窗口开始的剩余时间；
+        不是限流报错时返回 None。
+        """
+        for marker, window in _RATE_LIMIT_WINDOWS.items():
+            if marker in message:
+                return window - time.time() % window
+        return None
+
+    def _retry(self, func, *args, **kwargs):
+        """带重试的函数调用，把 TuShare 的限流报错转成带 retry_after 的 CollectorError"""
+        def call():
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                retry_after = self._rate_limit_retry_after(str(e))
+                if retry_after is not None:
+                    raise CollectorError(str(e), retry_after=retry_after) from e
+                raise
+
+        return super()._retry(call)
 
     def _fetch_stock_list(self) -> pd.DataFrame:
         """获取A股股票列表
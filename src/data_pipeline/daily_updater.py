@@ -1,4 +1,5 @@
 """每日数据更新Pipeline"""
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import date, datetime, timedelta
 import pandas as pd
@@ -47,10 +48,14 @@ class DailyUpdater:
         self.storage = storage
         self.database = database
         self.news_crawler = news_crawler or NewsCrawler()
+        # data_type -> 已确认成功更新到的最新交易日期，命中时无需再查数据库
+        self._updated_through: Dict[str, str] = {}
 
     def _is_already_updated(self, data_type: str, trade_date: str) -> bool:
         """检查数据是否已更新
 
+        只缓存"已更新"的结论；未更新时每次都查数据库，以便看到其他进程写入的日志。
+
         Args:
             data_type: 数据类型
             trade_date: 交易日期
@@ -58,11 +63,32 @@ class DailyUpdater:
         Returns:
             是否已更新
         """
+        cached = self._updated_through.get(data_type)
+        if cached is not None and cached >= trade_date:
+            return True
+
         latest = self.database.get_latest_update(data_type)
         if latest and latest["trade_date"] >= trade_date and latest["status"] == "success":
+            self._updated_through[data_type] = latest["trade_date"]
             return True
         return False
 
+    def _log_update(self, data_type: str, trade_date: str, status: str, **kwargs) -> None:
+        """写更新日志，并同步"已更新"缓存
+
+        成功时推进该类型的缓存日期；失败的日志会成为数据库里的最新记录，
+        此时清除缓存，下次检查回到数据库判断。
+        """
+        self.database.log_update(
+            data_type=data_type, trade_date=trade_date, status=status, **kwargs
+        )
+        if status == "success":
+            cached = self._updated_through.get(data_type)
+            if cached is None or trade_date > cached:
+                self._updated_through[data_type] = trade_date
+        else:
+            self._updated_through.pop(data_type, None)
+
     def update_daily(self, trade_date: str, force: bool = False) -> Dict[str, Any]:
         """更新日线数据
 
@@ -92,7 +118,7 @@ class DailyUpdater:
             self.storage.append_daily(year, df)
 
             # 记录日志
-            self.database.log_update(
+            self._log_update(
                 data_type="daily",
                 trade_date=trade_date,
                 record_count=len(df),
@@ -108,7 +134,7 @@ class DailyUpdater:
 
         except Exception as e:
             logger.error(f"日线数据更新失败: {e}")
-            self.database.log_update(
+            self._log_update(
                 data_type="daily",
                 trade_date=trade_date,
                 record_count=0,
@@ -154,7 +180,7 @@ class DailyUpdater:
             year = trade_date[:4]
             self.storage.append_index(year, combined)
 
-            self.database.log_update(
+            self._log_update(
                 data_type="index",
                 trade_date=trade_date,
                 record_count=len(combined),
@@ -170,7 +196,7 @@ class DailyUpdater:
 
         except Exception as e:
             logger.error(f"指数数据更新失败: {e}")
-            self.database.log_update(
+            self._log_update(
                 data_type="index",
                 trade_date=trade_date,
                 record_count=0,
@@ -205,7 +231,7 @@ class DailyUpdater:
             year = trade_date[:4]
             self.storage.append_money_flow(year, df)
 
-            self.database.log_update(
+            self._log_update(
                 data_type="money_flow",
                 trade_date=trade_date,
                 record_count=len(df),
@@ -221,7 +247,7 @@ class DailyUpdater:
 
         except Exception as e:
             logger.error(f"资金流数据更新失败: {e}")
-            self.database.log_update(
+            self._log_update(
                 data_type="money_flow",
                 trade_date=trade_date,
                 record_count=0,
@@ -288,19 +314,17 @@ class DailyUpdater:
         """
         logger.info(f"========== 开始每日全量更新: {trade_date} ==========")
 
-        results = {}
-
-        # 1. 更新日线数据
-        results["daily"] = self.update_daily(trade_date, force)
-
-        # 2. 更新指数数据
-        results["index"] = self.update_index(trade_date, force)
-
-        # 3. 更新资金流数据
-        results["money_flow"] = self.update_money_flow(trade_date, force)
-
-        # 4. 更新新闻
-        results["news"] = self.update_news(trade_date)
+        # 日线、指数、资金流、新闻四项更新互不依赖，并发执行以重叠网络等待；
+        # TuShare 请求由采集器共享的令牌桶限速，并发不会突破频次限制
+        steps = {
+            "daily": lambda: self.update_daily(trade_date, force),
+            "index": lambda: self.update_index(trade_date, force),
+            "money_flow": lambda: self.update_money_flow(trade_date, force),
+            "news": lambda: self.update_news(trade_date),
+        }
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = {name: executor.submit(step) for name, step in steps.items()}
+            results = {name: future.result() for name, future in futures.items()}
 
         # 统计结果
         success_count = sum(
@@ -14,6 +14,211 @@ except ImportError:
     HAS_PG = False
 
 
+# SQLite 连接参数：WAL 让读写互不阻塞，提交时少一次 fsync；临时表放内存，数据文件用 mmap 读取
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# SQLite 建表语句（均为 IF NOT EXISTS，可重复执行）；依赖现有表结构的迁移在 init_tables 中处理
+_SQLITE_SCHEMA = """
+-- 股票列表表
+CREATE TABLE IF NOT EXISTS stock_list (
+    ts_code TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    industry TEXT,
+    market TEXT,
+    list_date TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 数据更新日志表
+CREATE TABLE IF NOT EXISTS data_update_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data_type TEXT NOT NULL,
+    trade_date TEXT NOT NULL,
+    record_count INTEGER,
+    status TEXT,
+    error_msg TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 新闻情绪表（旧表，保留兼容）
+CREATE TABLE IF NOT EXISTS news_sentiment (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    trade_date TEXT NOT NULL,
+    title TEXT NOT NULL,
+    source TEXT,
+    sentiment_score REAL,
+    keywords TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 新闻存档表（完整字段，支持去重）
+CREATE TABLE IF NOT EXISTS news_archive (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title_hash TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL,
+    sentiment_score REAL,
+    keywords TEXT,
+    url TEXT,
+    publish_time TEXT,
+    content TEXT,
+    fetch_date TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 为常用查询创建索引
+-- get_latest_update 按 (trade_date, created_at) 倒序取第一条，索引需覆盖完整排序键，
+-- 否则每次都要对该类型的全部日志做临时排序；旧的两列索引是它的前缀，删除
+DROP INDEX IF EXISTS idx_update_log_type_date;
+CREATE INDEX IF NOT EXISTS idx_update_log_latest
+ON data_update_log(data_type, trade_date DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_news_date
+ON news_sentiment(trade_date DESC);
+CREATE INDEX IF NOT EXISTS idx_news_archive_date
+ON news_archive(fetch_date DESC);
+CREATE INDEX IF NOT EXISTS idx_news_archive_source
+ON news_archive(source, fetch_date DESC);
+CREATE INDEX IF NOT EXISTS idx_news_archive_sentiment
+ON news_archive(sentiment_score);
+
+-- 交易信号表（永久存储，支持历史回测）
+CREATE TABLE IF NOT EXISTS trading_signals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stock_code TEXT NOT NULL,
+    trade_date TEXT NOT NULL,
+    final_score REAL NOT NULL,
+    signal_level INTEGER NOT NULL,
+    signal_level_name TEXT NOT NULL,
+    swing_score REAL,
+    trend_score REAL,
+    ml_score REAL,
+    sentiment_score REAL,
+    market_regime TEXT,
+    swing_weight REAL,
+    trend_weight REAL,
+    reasons TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(stock_code, trade_date)
+);
+CREATE INDEX IF NOT EXISTS idx_signals_date
+ON trading_signals(trade_date DESC);
+CREATE INDEX IF NOT EXISTS idx_signals_stock
+ON trading_signals(stock_code, trade_date DESC);
+CREATE INDEX IF NOT EXISTS idx_signals_level
+ON trading_signals(signal_level, trade_date DESC);
+
+-- 股票日线数据表（缓存历史行情，避免重复 API 调用）
+CREATE TABLE IF NOT EXISTS stock_daily (
+    stock_code TEXT NOT NULL,
+    trade_date TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume REAL,
+    amount REAL,
+    PRIMARY KEY (stock_code, trade_date)
+);
+CREATE INDEX IF NOT EXISTS idx_daily_code_date
+ON stock_daily(stock_code, trade_date DESC);
+
+-- 指标配置表（管理所有可用的技术指标实例）
+CREATE TABLE IF NOT EXISTS indicator_config (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    indicator_type TEXT NOT NULL,
+    name TEXT NOT NULL UNIQUE,
+    params TEXT NOT NULL DEFAULT '{}',
+    enabled INTEGER NOT NULL DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 信号策略表（规则驱动的策略）
+CREATE TABLE IF NOT EXISTS signal_strategy (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT DEFAULT '',
+    rules TEXT NOT NULL DEFAULT '[]',
+    weight REAL NOT NULL DEFAULT 0.5,
+    enabled INTEGER NOT NULL DEFAULT 1,
+    buy_conditions TEXT NOT NULL DEFAULT '[]',
+    sell_conditions TEXT NOT NULL DEFAULT '[]',
+    exit_config TEXT NOT NULL DEFAULT '{}',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 动作信号表（回测系统的精确买卖指令）
+CREATE TABLE IF NOT EXISTS action_signals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stock_code TEXT NOT NULL,
+    trade_date TEXT NOT NULL,
+    action TEXT NOT NULL,
+    strategy_name TEXT NOT NULL,
+    confidence_score REAL,
+    sell_reason TEXT,
+    trigger_rules TEXT,
+    stop_loss_pct REAL,
+    take_profit_pct REAL,
+    max_hold_days INTEGER,
+    reasons TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(stock_code, trade_date, action, strategy_name)
+);
+CREATE INDEX IF NOT EXISTS idx_action_signals_date
+ON action_signals(trade_date DESC, action);
+CREATE INDEX IF NOT EXISTS idx_action_signals_stock
+ON action_signals(stock_code, trade_date DESC);
+
+-- 回测运行记录表
+CREATE TABLE IF NOT EXISTS backtest_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    strategy_id INTEGER NOT NULL,
+    strategy_name TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    capital_per_trade REAL DEFAULT 10000,
+    total_trades INTEGER,
+    win_rate REAL,
+    total_return_pct REAL,
+    max_drawdown_pct REAL,
+    avg_hold_days REAL,
+    result_json TEXT,
+    created_at TEXT DEFAULT (datetime('now', 'localtime')),
+    FOREIGN KEY (strategy_id) REFERENCES signal_strategy(id)
+);
+
+-- 回测交易明细表
+CREATE TABLE IF NOT EXISTS backtest_trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL,
+    stock_code TEXT NOT NULL,
+    strategy_name TEXT,
+    buy_date TEXT,
+    buy_price REAL,
+    sell_date TEXT,
+    sell_price REAL,
+    sell_reason TEXT,
+    pnl_pct REAL,
+    hold_days INTEGER,
+    FOREIGN KEY (run_id) REFERENCES backtest_runs(id)
+);
+CREATE INDEX IF NOT EXISTS idx_backtest_trades_run
+ON backtest_trades(run_id);
+"""
+
+# 指定数据类型的最新一条更新记录；排序键与 idx_update_log_latest 一致，可直接走索引
+_LATEST_UPDATE_SQL = """
+SELECT * FROM data_update_log
+WHERE data_type = ?
+ORDER BY trade_date DESC, created_at DESC
+LIMIT 1
+"""
+
+
 class _DictRow(dict):
     """Dict that also supports integer index access (for SQLite compat)."""
 
@@ -144,6 +349,8 @@ class Database:
         else:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
+            for pragma in _SQLITE_PRAGMAS:
+                conn.execute(pragma)
             try:
                 yield conn
                 conn.commit()
@@ -177,84 +384,10 @@ class Database:
             return  # Tables created by migration script or SQLAlchemy ORM
 
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # 股票列表表
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS stock_list (
-                    ts_code TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    industry TEXT,
-                    market TEXT,
-                    list_date TEXT,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # 数据更新日志表
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS data_update_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    data_type TEXT NOT NULL,
-                    trade_date TEXT NOT NULL,
-                    record_count INTEGER,
-                    status TEXT,
-                    error_msg TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            # 所有建表/建索引语句放在一个事务里执行，只提交一次
+            conn.executescript(f"BEGIN;\n{_SQLITE_SCHEMA}\nCOMMIT;")
 
-            # 新闻情绪表（旧表，保留兼容）
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS news_sentiment (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    trade_date TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    source TEXT,
-                    sentiment_score REAL,
-                    keywords TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # 新闻存档表（完整字段，支持去重）
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS news_archive (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title_hash TEXT NOT NULL UNIQUE,
-                    title TEXT NOT NULL,
-                    source TEXT NOT NULL,
-                    sentiment_score REAL,
-                    keywords TEXT,
-                    url TEXT,
-                    publish_time TEXT,
-                    content TEXT,
-                    fetch_date TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # 为常用查询创建索引
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_update_log_type_date
-                ON data_update_log(data_type, trade_date DESC)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_news_date
-                ON news_sentiment(trade_date DESC)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_news_archive_date
-                ON news_archive(fetch_date DESC)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_news_archive_source
-                ON news_archive(source, fetch_date DESC)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_news_archive_sentiment
-                ON news_archive(sentiment_score)
-            """)
+            cursor = conn.cursor()
 
             # Add sentiment_analyzed column if missing (migration)
             try:
@@ -264,87 +397,6 @@ class Database:
             except Exception:
                 pass  # Column already exists
 
-            # 交易信号表（永久存储，支持历史回测）
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS trading_signals (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    stock_code TEXT NOT NULL,
-                    trade_date TEXT NOT NULL,
-                    final_score REAL NOT NULL,
-                    signal_level INTEGER NOT NULL,
-                    signal_level_name TEXT NOT NULL,
-                    swing_score REAL,
-                    trend_score REAL,
-                    ml_score REAL,
-                    sentiment_score REAL,
-                    market_regime TEXT,
-                    swing_weight REAL,
-                    trend_weight REAL,
-                    reasons TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(stock_code, trade_date)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_signals_date
-                ON trading_signals(trade_date DESC)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_signals_stock
-                ON trading_signals(stock_code, trade_date DESC)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_signals_level
-                ON trading_signals(signal_level, trade_date DESC)
-            """)
-
-            # 股票日线数据表（缓存历史行情，避免重复 API 调用）
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS stock_daily (
-                    stock_code TEXT NOT NULL,
-                    trade_date TEXT NOT NULL,
-                    open REAL,
-                    high REAL,
-                    low REAL,
-                    close REAL,
-                    volume REAL,
-                    amount REAL,
-                    PRIMARY KEY (stock_code, trade_date)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_daily_code_date
-                ON stock_daily(stock_code, trade_date DESC)
-            """)
-
-            # 指标配置表（管理所有可用的技术指标实例）
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS indicator_config (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    indicator_type TEXT NOT NULL,
-                    name TEXT NOT NULL UNIQUE,
-                    params TEXT NOT NULL DEFAULT '{}',
-                    enabled INTEGER NOT NULL DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # 信号策略表（规则驱动的策略）
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS signal_strategy (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL UNIQUE,
-                    description TEXT DEFAULT '',
-                    rules TEXT NOT NULL DEFAULT '[]',
-                    weight REAL NOT NULL DEFAULT 0.5,
-                    enabled INTEGER NOT NULL DEFAULT 1,
-                    buy_conditions TEXT NOT NULL DEFAULT '[]',
-                    sell_conditions TEXT NOT NULL DEFAULT '[]',
-                    exit_config TEXT NOT NULL DEFAULT '{}',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
             # 迁移：如果旧表有 indicators 列但无 rules 列，重建表
             cursor.execute("PRAGMA table_info(signal_strategy)")
             columns = {row[1] for row in cursor.fetchall()}
@@ -382,76 +434,6 @@ class Database:
                     except sqlite3.OperationalError:
                         pass  # 列已存在
 
-            # 动作信号表（回测系统的精确买卖指令）
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS action_signals (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    stock_code TEXT NOT NULL,
-                    trade_date TEXT NOT NULL,
-                    action TEXT NOT NULL,
-                    strategy_name TEXT NOT NULL,
-                    confidence_score REAL,
-                    sell_reason TEXT,
-                    trigger_rules TEXT,
-                    stop_loss_pct REAL,
-                    take_profit_pct REAL,
-                    max_hold_days INTEGER,
-                    reasons TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(stock_code, trade_date, action, strategy_name)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_action_signals_date
-                ON action_signals(trade_date DESC, action)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_action_signals_stock
-                ON action_signals(stock_code, trade_date DESC)
-            """)
-
-            # 回测运行记录表
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS backtest_runs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    strategy_id INTEGER NOT NULL,
-                    strategy_name TEXT NOT NULL,
-                    start_date TEXT NOT NULL,
-                    end_date TEXT NOT NULL,
-                    capital_per_trade REAL DEFAULT 10000,
-                    total_trades INTEGER,
-                    win_rate REAL,
-                    total_return_pct REAL,
-                    max_drawdown_pct REAL,
-                    avg_hold_days REAL,
-                    result_json TEXT,
-                    created_at TEXT DEFAULT (datetime('now', 'localtime')),
-                    FOREIGN KEY (strategy_id) REFERENCES signal_strategy(id)
-                )
-            """)
-
-            # 回测交易明细表
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS backtest_trades (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_id INTEGER NOT NULL,
-                    stock_code TEXT NOT NULL,
-                    strategy_name TEXT,
-                    buy_date TEXT,
-                    buy_price REAL,
-                    sell_date TEXT,
-                    sell_price REAL,
-                    sell_reason TEXT,
-                    pnl_pct REAL,
-                    hold_days INTEGER,
-                    FOREIGN KEY (run_id) REFERENCES backtest_runs(id)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_backtest_trades_run
-                ON backtest_trades(run_id)
-            """)
-
     def save_daily_data(self, stock_code: str, rows: list) -> int:
         """批量保存日线数据
 
@@ -526,41 +508,30 @@ class Database:
         Args:
             stocks: 股票信息列表，每个元素包含ts_code, name, industry等
         """
+        ph = self._ph
+        # 位置参数元组 + 单条 executemany，整批在一个事务内提交；
+        # ON CONFLICT DO UPDATE 原地更新，避免 INSERT OR REPLACE 的先删后插
+        sql = f"""
+            INSERT INTO stock_list
+            (ts_code, name, industry, market, list_date, updated_at)
+            VALUES ({ph}, {ph}, {ph}, {ph}, {ph}, CURRENT_TIMESTAMP)
+            ON CONFLICT (ts_code) DO UPDATE SET
+                name=excluded.name, industry=excluded.industry,
+                market=excluded.market, list_date=excluded.list_date,
+                updated_at=CURRENT_TIMESTAMP
+        """
+        stock_params = [
+            (
+                s.get("ts_code"),
+                s.get("name"),
+                s.get("industry"),
+                s.get("market"),
+                s.get("list_date"),
+            )
+            for s in stocks
+        ]
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            stock_params = [
-                {
-                    "ts_code": s.get("ts_code"),
-                    "name": s.get("name"),
-                    "industry": s.get("industry"),
-                    "market": s.get("market"),
-                    "list_date": s.get("list_date"),
-                }
-                for s in stocks
-            ]
-            if self._use_pg:
-                sql = """
-                    INSERT INTO stock_list
-                    (ts_code, name, industry, market, list_date, updated_at)
-                    VALUES (
-                        %(ts_code)s, %(name)s, %(industry)s,
-                        %(market)s, %(list_date)s, CURRENT_TIMESTAMP
-                    )
-                    ON CONFLICT (ts_code) DO UPDATE SET
-                        name=EXCLUDED.name, industry=EXCLUDED.industry,
-                        market=EXCLUDED.market, list_date=EXCLUDED.list_date,
-                        updated_at=CURRENT_TIMESTAMP
-                """
-            else:
-                sql = """
-                    INSERT OR REPLACE INTO stock_list
-                    (ts_code, name, industry, market, list_date, updated_at)
-                    VALUES (
-                        :ts_code, :name, :industry,
-                        :market, :list_date, CURRENT_TIMESTAMP
-                    )
-                """
-            cursor.executemany(sql, stock_params)
+            conn.cursor().executemany(sql, stock_params)
 
     def get_stock_list(self) -> List[Dict[str, Any]]:
         """获取所有股票列表
@@ -598,6 +569,30 @@ class Database:
                 VALUES (?, ?, ?, ?, ?)
             """, (data_type, trade_date, record_count, status, error_msg))
 
+    def log_update_many(self, entries: List[Dict[str, Any]]) -> None:
+        """批量记录数据更新日志（一次 executemany，一个事务）
+
+        Args:
+            entries: 日志列表，每个元素包含 data_type, trade_date, record_count,
+                status 以及可选的 error_msg
+        """
+        params = [
+            (
+                e["data_type"],
+                e["trade_date"],
+                e["record_count"],
+                e["status"],
+                e.get("error_msg"),
+            )
+            for e in entries
+        ]
+        with self._get_connection() as conn:
+            conn.cursor().executemany("""
+                INSERT INTO data_update_log
+                (data_type, trade_date, record_count, status, error_msg)
+                VALUES (?, ?, ?, ?, ?)
+            """, params)
+
     def get_latest_update(self, data_type: str) -> Optional[Dict[str, Any]]:
         """获取指定数据类型的最新更新记录
 
@@ -609,12 +604,7 @@ class Database:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM data_update_log
-                WHERE data_type = ?
-                ORDER BY trade_date DESC, created_at DESC
-                LIMIT 1
-            """, (data_type,))
+            cursor.execute(_LATEST_UPDATE_SQL, (data_type,))
             row = cursor.fetchone()
             return dict(row) if row else None
 
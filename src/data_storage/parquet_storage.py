@@ -1,13 +1,19 @@
 """Parquet文件存储管理模块"""
 import os
-from typing import Optional
+from typing import Iterator, Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 
 class ParquetStorage:
     """Parquet文件存储管理器
 
     按年份分区存储历史K线数据，支持增量追加和日期范围查询。
+    每个年份文件内按 trade_date 排序、一个月一个行组（保存和追加都维持这一布局），
+    日期和代码条件下推到 Arrow，借助行组统计信息只读取命中的月份。
 
     目录结构:
         {base_dir}/
@@ -56,13 +62,52 @@ class ParquetStorage:
             df: 数据DataFrame
         """
         file_path = self._get_file_path(data_type, year)
-        df.to_parquet(file_path, index=False, compression="snappy")
+        if "trade_date" not in df.columns or len(df) == 0:
+            df.to_parquet(file_path, index=False, compression="snappy")
+            return
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pq.ParquetWriter(file_path, table.schema, compression="snappy") as writer:
+            for row_group in self._month_row_groups(table):
+                writer.write_table(row_group)
+
+    @staticmethod
+    def _month_row_groups(table: pa.Table) -> Iterator[pa.Table]:
+        """按 trade_date 排序后切成每月一个的行组"""
+        if "trade_date" not in table.column_names:
+            yield table
+            return
+        table = table.sort_by("trade_date")
+        months = pc.utf8_slice_codeunits(
+            pc.cast(table["trade_date"], pa.string()), 0, 6
+        ).to_numpy(zero_copy_only=False)
+        bounds = [0, *(np.flatnonzero(months[1:] != months[:-1]) + 1), len(months)]
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            yield table.slice(lo, hi - lo)
+
+    @staticmethod
+    def _filters(
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        ts_codes: Optional[list] = None,
+    ) -> Optional[list]:
+        """把查询条件转换为下推给Arrow的过滤表达式"""
+        filters = []
+        if start_date:
+            filters.append(("trade_date", ">=", start_date))
+        if end_date:
+            filters.append(("trade_date", "<=", end_date))
+        if ts_codes:
+            filters.append(("ts_code", "in", list(ts_codes)))
+        return filters or None
 
     def _load(
         self,
         data_type: str,
         year: str,
         columns: Optional[list] = None,
+        filters: Optional[list] = None,
+        dictionary_columns: Optional[list] = None,
     ) -> pd.DataFrame:
         """加载Parquet文件
 
@@ -70,6 +115,8 @@ class ParquetStorage:
             data_type: 数据类型
             year: 年份
             columns: 要加载的列（可选）
+            filters: 下推的过滤条件（可选），不命中的行组不会被读取
+            dictionary_columns: 直接按字典编码读取为 category 的列（可选）
 
         Returns:
             数据DataFrame，文件不存在返回空DataFrame
@@ -78,16 +125,122 @@ class ParquetStorage:
         if not os.path.exists(file_path):
             return pd.DataFrame()
 
-        return pd.read_parquet(file_path, columns=columns)
+        return pd.read_parquet(
+            file_path,
+            columns=columns,
+            filters=filters,
+            read_dictionary=dictionary_columns,
+        )
+
+    @staticmethod
+    def _categorize_codes(df: pd.DataFrame) -> pd.DataFrame:
+        """把 ts_code 整理为按字典序排列、无多余类别的 category 列
+
+        类别有序后 sort_values 仍按代码字典序排序。
+        """
+        if "ts_code" not in df.columns:
+            return df
+        codes = df["ts_code"]
+        if isinstance(codes.dtype, pd.CategoricalDtype):
+            codes = codes.cat.remove_unused_categories()
+            codes = codes.cat.set_categories(sorted(codes.cat.categories))
+        else:
+            codes = codes.astype("category")
+        return df.assign(ts_code=codes)
 
     def _append(self, data_type: str, year: str, df: pd.DataFrame) -> None:
         """追加数据到现有文件
 
+        以行组为单位流式重写：文件内每个月一个行组，新数据按月切分后与同月的
+        旧行组合并（剔除重复的 (ts_code, trade_date) 后按 trade_date 排序）再写入
+        临时文件，不涉及的月份原样写出。内存占用只与单个月份相关，而不是整年数据。
+        列结构不一致、或旧文件不是按月一个行组的布局时回退到整表合并。
+
         Args:
             data_type: 数据类型
             year: 年份
             df: 要追加的数据
         """
+        file_path = self._get_file_path(data_type, year)
+        if not os.path.exists(file_path):
+            self._save(data_type, year, df)
+            return
+
+        has_keys = "ts_code" in df.columns and "trade_date" in df.columns
+        if has_keys:
+            df = df.drop_duplicates(subset=["ts_code", "trade_date"], keep="last")
+
+        tmp_path = file_path + ".tmp"
+        with pq.ParquetFile(file_path) as existing:
+            schema = existing.schema_arrow
+            months = self._row_group_months(existing)
+            if set(df.columns) != set(schema.names) or months is None:
+                self._append_rewrite(data_type, year, df)
+                return
+            try:
+                new_table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                self._append_rewrite(data_type, year, df)
+                return
+
+            new_keys = self._row_keys(new_table) if has_keys else None
+            new_parts = {}
+            if new_table.num_rows > 0:
+                for part in self._month_row_groups(new_table):
+                    new_parts[str(part["trade_date"][0].as_py())[:6]] = part
+            pending = sorted(new_parts)
+
+            try:
+                with pq.ParquetWriter(tmp_path, schema, compression="snappy") as writer:
+                    for i, month in enumerate(months):
+                        # 早于当前月份的新月份（补录）插在它前面，保持文件按月递增
+                        while pending and pending[0] < month:
+                            writer.write_table(new_parts[pending.pop(0)])
+                        row_group = existing.read_row_group(i)
+                        if pending and pending[0] == month:
+                            if new_keys is not None:
+                                duplicated = pc.is_in(self._row_keys(row_group), value_set=new_keys)
+                                row_group = row_group.filter(pc.invert(duplicated))
+                            row_group = pa.concat_tables(
+                                [row_group, new_parts[pending.pop(0)]]
+                            ).sort_by("trade_date")
+                        writer.write_table(row_group)
+                    for month in pending:
+                        writer.write_table(new_parts[month])
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        os.replace(tmp_path, file_path)
+
+    @staticmethod
+    def _row_group_months(parquet_file: pq.ParquetFile) -> Optional[list]:
+        """从行组统计信息读出每个行组所属的月份 (YYYYMM)
+
+        Returns:
+            按行组顺序排列的月份列表；文件没有 trade_date 列、缺少统计信息，
+            或不是每月一个行组且月份递增的布局时返回 None
+        """
+        metadata = parquet_file.metadata
+        names = parquet_file.schema_arrow.names
+        if "trade_date" not in names:
+            return None
+        column = names.index("trade_date")
+
+        months = []
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(column).statistics
+            if stats is None or not stats.has_min_max:
+                return None
+            month, last = str(stats.min)[:6], str(stats.max)[:6]
+            if month != last or (months and month <= months[-1]):
+                return None
+            months.append(month)
+        return months
+
+    def _append_rewrite(self, data_type: str, year: str, df: pd.DataFrame) -> None:
+        """整表读出合并后重写（列结构变化时使用）"""
         existing = self._load(data_type, year)
         if len(existing) > 0:
             combined = pd.concat([existing, df], ignore_index=True)
@@ -102,6 +255,15 @@ class ParquetStorage:
 
         self._save(data_type, year, combined)
 
+    @staticmethod
+    def _row_keys(table: pa.Table) -> pa.Array:
+        """拼接 ts_code|trade_date 作为行的去重键"""
+        return pc.binary_join_element_wise(
+            pc.cast(table["ts_code"], pa.string()),
+            pc.cast(table["trade_date"], pa.string()),
+            "|",
+        )
+
     # ===== Daily Data =====
 
     def save_daily(self, year: str, df: pd.DataFrame) -> None:
@@ -128,6 +290,7 @@ class ParquetStorage:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         ts_codes: Optional[list] = None,
+        columns: Optional[list] = None,
     ) -> pd.DataFrame:
         """加载日线数据
 
@@ -136,22 +299,43 @@ class ParquetStorage:
             start_date: 开始日期 (YYYYMMDD)
             end_date: 结束日期 (YYYYMMDD)
             ts_codes: 股票代码列表
+            columns: 要加载的列（可选），只返回这些列（按给定顺序），过滤条件所用的列无需包含在内
 
         Returns:
-            日线数据DataFrame
+            日线数据DataFrame，按 ts_code、trade_date 排序，
+            ts_code 为 category 类型（字典编码，类别按字典序）
         """
-        df = self._load("daily", year)
+        df = self._load(
+            "daily",
+            year,
+            columns=self._with_sort_keys(columns),
+            filters=self._filters(start_date, end_date, ts_codes),
+            dictionary_columns=["ts_code"],
+        )
         if len(df) == 0:
-            return df
+            return df if columns is None else df.reindex(columns=columns)
 
-        if start_date:
-            df = df[df["trade_date"] >= start_date]
-        if end_date:
-            df = df[df["trade_date"] <= end_date]
-        if ts_codes:
-            df = df[df["ts_code"].isin(ts_codes)]
+        return self._sort_rows(self._categorize_codes(df), columns)
 
-        return df.sort_values(["ts_code", "trade_date"]).reset_index(drop=True)
+    _SORT_KEYS = ["ts_code", "trade_date"]
+
+    @classmethod
+    def _with_sort_keys(cls, columns: Optional[list]) -> Optional[list]:
+        """在要加载的列后补上排序所需的 ts_code、trade_date"""
+        if columns is None:
+            return None
+        return list(columns) + [key for key in cls._SORT_KEYS if key not in columns]
+
+    @classmethod
+    def _sort_rows(cls, df: pd.DataFrame, columns: Optional[list] = None) -> pd.DataFrame:
+        """按 ts_code、trade_date 排序，再只保留调用方请求的列
+
+        排序键总是随数据一起读取，即使调用方没有请求这两列，行顺序也不变。
+        """
+        df = df.sort_values(cls._SORT_KEYS).reset_index(drop=True)
+        if columns is not None:
+            df = df[list(columns)]
+        return df
 
     # ===== Index Data =====
 
@@ -170,15 +354,10 @@ class ParquetStorage:
         end_date: Optional[str] = None,
     ) -> pd.DataFrame:
         """加载指数数据"""
-        df = self._load("index", year)
+        df = self._load("index", year, filters=self._filters(start_date, end_date))
         if len(df) == 0:
             return df
 
-        if start_date:
-            df = df[df["trade_date"] >= start_date]
-        if end_date:
-            df = df[df["trade_date"] <= end_date]
-
         return df.sort_values(["ts_code", "trade_date"]).reset_index(drop=True)
 
     # ===== Money Flow Data =====
@@ -198,15 +377,10 @@ class ParquetStorage:
         end_date: Optional[str] = None,
     ) -> pd.DataFrame:
         """加载资金流数据"""
-        df = self._load("money_flow", year)
+        df = self._load("money_flow", year, filters=self._filters(start_date, end_date))
         if len(df) == 0:
             return df
 
-        if start_date:
-            df = df[df["trade_date"] >= start_date]
-        if end_date:
-            df = df[df["trade_date"] <= end_date]
-
         return df.sort_values(["ts_code", "trade_date"]).reset_index(drop=True)
 
     # ===== Utilities =====
@@ -236,6 +410,7 @@ class ParquetStorage:
         start_date: str,
         end_date: str,
         ts_codes: Optional[list] = None,
+        columns: Optional[list] = None,
     ) -> pd.DataFrame:
         """加载跨年份的日线数据
 
@@ -243,6 +418,7 @@ class ParquetStorage:
             start_date: 开始日期 (YYYYMMDD)
             end_date: 结束日期 (YYYYMMDD)
             ts_codes: 股票代码列表
+            columns: 要加载的列（可选）
 
         Returns:
             合并的日线数据
@@ -257,6 +433,7 @@ class ParquetStorage:
                 start_date=start_date if year == start_year else None,
                 end_date=end_date if year == end_year else None,
                 ts_codes=ts_codes,
+                columns=self._with_sort_keys(columns),
             )
             if len(df) > 0:
                 dfs.append(df)
@@ -264,6 +441,6 @@ class ParquetStorage:
         if not dfs:
             return pd.DataFrame()
 
-        return pd.concat(dfs, ignore_index=True).sort_values(
-            ["ts_code", "trade_date"]
-        ).reset_index(drop=True)
+        # 各年份的类别集合不同，合并后 ts_code 退化为普通字符串，需重新编码
+        combined = self._categorize_codes(pd.concat(dfs, ignore_index=True))
+        return self._sort_rows(combined, columns)
@@ -9,10 +9,11 @@ from .base_signal import (
     SignalLevel,
     SignalResult,
     BaseStrategy,
-    score_to_signal_level
+    score_to_signal_level,
+    scores_to_signal_levels,
 )
-from .swing_strategy import SwingStrategy
-from .trend_strategy import TrendStrategy
+from .swing_strategy import SwingStrategy, SwingRow
+from .trend_strategy import TrendStrategy, TrendRow
 from .signal_combiner import SignalCombiner, CombinedSignal
 from .daily_signal_generator import DailySignalGenerator, DailySignalReport
 from .market_regime import MarketRegime, MarketRegimeDetector
@@ -23,9 +24,12 @@ __all__ = [
     "SignalResult",
     "BaseStrategy",
     "score_to_signal_level",
+    "scores_to_signal_levels",
     # Strategies
     "SwingStrategy",
+    "SwingRow",
     "TrendStrategy",
+    "TrendRow",
     # Combiner
     "SignalCombiner",
     "CombinedSignal",
@@ -1,12 +1,17 @@
 """Base classes and types for trading signal generation."""
 
+import math
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Optional, Any
 
+import numpy as np
 import pandas as pd
 
+from src.utils.jit import njit
+
 
 class SignalLevel(IntEnum):
     """Trading signal strength levels.
@@ -26,11 +31,50 @@ class SignalLevel(IntEnum):
 
     def is_bullish(self) -> bool:
         """Check if signal indicates bullish sentiment."""
-        return self.value >= 4
+        return self in _BULLISH_LEVELS
 
     def is_bearish(self) -> bool:
         """Check if signal indicates bearish sentiment."""
-        return self.value <= 2
+        return self in _BEARISH_LEVELS
+
+
+_BULLISH_LEVELS = frozenset({SignalLevel.WEAK_BUY, SignalLevel.STRONG_BUY})
+_BEARISH_LEVELS = frozenset({SignalLevel.STRONG_SELL, SignalLevel.WEAK_SELL})
+
+
+@njit(cache=True)
+def clamp_score(score, low=0.0, high=100.0):
+    """Clamp a score to [low, high] with the same NaN handling as max(low, min(high, score))."""
+    capped = score if score < high else high
+    return capped if capped > low else low
+
+
+@njit(cache=True)
+def safe_divide(num, den):
+    """num / den with NumPy float semantics: x/0 -> +-inf, 0/0 and nan/0 -> nan.
+
+    The scoring kernels take plain floats, where a zero divisor would raise.
+    """
+    if den == 0.0:
+        if num != num or num == 0.0:
+            return math.nan
+        return math.copysign(math.inf, num) * math.copysign(1.0, den)
+    return num / den
+
+
+# Lower score bound of each level above STRONG_SELL; a score's level is the
+# number of bounds it reaches. Out-of-range scores land in the end levels,
+# which is the same as clamping to 0-100 first.
+_LEVEL_BOUNDS = (20.0, 40.0, 60.0, 80.0)
+_LEVEL_BINS = np.array(_LEVEL_BOUNDS)
+_LEVELS = (
+    SignalLevel.STRONG_SELL,
+    SignalLevel.WEAK_SELL,
+    SignalLevel.HOLD,
+    SignalLevel.WEAK_BUY,
+    SignalLevel.STRONG_BUY,
+)
+_LEVELS_ARR = np.array(_LEVELS, dtype=object)
 
 
 def score_to_signal_level(score: float) -> SignalLevel:
@@ -49,22 +93,22 @@ def score_to_signal_level(score: float) -> SignalLevel:
     Returns:
         Corresponding SignalLevel
     """
-    # Clamp score to valid range
-    score = max(0, min(100, score))
-
-    if score >= 80:
-        return SignalLevel.STRONG_BUY
-    elif score >= 60:
-        return SignalLevel.WEAK_BUY
-    elif score >= 40:
-        return SignalLevel.HOLD
-    elif score >= 20:
-        return SignalLevel.WEAK_SELL
-    else:
-        return SignalLevel.STRONG_SELL
-
-
-@dataclass
+    return _LEVELS[bisect_right(_LEVEL_BOUNDS, score)]
+
+
+def scores_to_signal_levels(scores) -> np.ndarray:
+    """Vectorized score_to_signal_level.
+
+    Args:
+        scores: Array-like of numeric scores
+
+    Returns:
+        Object array of SignalLevel, one per score
+    """
+    return _LEVELS_ARR[np.searchsorted(_LEVEL_BINS, scores, side="right")]
+
+
+@dataclass(slots=True, frozen=True)
 class SignalResult:
     """Container for strategy signal output.
 
@@ -1,10 +1,15 @@
 """规则引擎：基于条件+动作模式的信号评估，支持指标参数化"""
 
+import functools
 import logging
 import math
+from operator import gt, lt, ge, le
 from typing import List, Dict, Any, Tuple, Optional, Set
+import numpy as np
 import pandas as pd
 
+from src.utils.jit import njit
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,6 +113,11 @@ OPERATORS = [
     ("<=", "小于等于"),
 ]
 
+# 运算符查表：比较函数 / 合法符号 / 在可达性检查中收紧的边界（True=下限, False=上限）
+_COMPARATORS = {">": gt, "<": lt, ">=": ge, "<=": le}
+_OPERATOR_SYMBOLS = frozenset(op for op, _ in OPERATORS)
+_BOUND_SIDE = {">": True, ">=": True, "<": False, "<=": False}
+
 
 # ── 默认参数 & 向后兼容 ──────────────────────────────────
 
@@ -329,16 +339,19 @@ def evaluate_rules(
     rules: List[Dict[str, Any]],
     indicator_df: pd.DataFrame,
     base_score: float = 50.0,
+    latest: Optional[pd.Series] = None,
 ) -> Tuple[float, List[str]]:
     """评估一组规则，返回得分和触发原因
 
     规则中可带 params 字段指定指标参数，
     系统会将 (field, params) 映射到 DataFrame 的实际列名。
+    latest 可传入已取好的 indicator_df.iloc[-1]，多组规则共用同一行时避免重复取行。
     """
     if indicator_df.empty:
         return base_score, []
 
-    latest = indicator_df.iloc[-1]
+    if latest is None:
+        latest = indicator_df.iloc[-1]
     total_score = base_score
     reasons = []
 
@@ -425,15 +438,51 @@ def _evaluate_single_rule(
 
 def _compare(left: float, operator: str, right: float) -> bool:
     """Apply comparison operator."""
-    if operator == ">":
-        return left > right
-    elif operator == "<":
-        return left < right
-    elif operator == ">=":
-        return left >= right
-    elif operator == "<=":
-        return left <= right
-    return False
+    fn = _COMPARATORS.get(operator)
+    return fn(left, right) if fn is not None else False
+
+
+def _column_values(df: pd.DataFrame, col_name: str) -> Optional[np.ndarray]:
+    """Return a column as a float64 array for the JIT kernels (None if non-numeric)."""
+    try:
+        return df[col_name].to_numpy(dtype=np.float64, na_value=np.nan)
+    except (ValueError, TypeError):
+        return None
+
+
+@njit(cache=True)
+def _lookback_extreme_kernel(values, n, want_min):
+    """MIN/MAX of the N values before the last one, skipping NaN (NaN if all NaN)."""
+    end = values.shape[0] - 1
+    result = np.nan
+    for i in range(end - n, end):
+        v = values[i]
+        if np.isnan(v):
+            continue
+        if np.isnan(result) or (v < result if want_min else v > result):
+            result = v
+    return result
+
+
+_CONSECUTIVE_DIRECTIONS = {"rising": 1, "falling": -1}
+
+
+@njit(cache=True)
+def _consecutive_kernel(values, n, direction):
+    """True if the last N+1 values have no NaN and move strictly in `direction`.
+
+    direction: 1 = rising, -1 = falling, 0 = only the NaN check applies.
+    """
+    start = values.shape[0] - (n + 1)
+    for i in range(start, values.shape[0]):
+        if np.isnan(values[i]):
+            return False
+    for i in range(start + 1, values.shape[0]):
+        if direction == 1 and values[i] <= values[i - 1]:
+            return False
+        if direction == -1 and values[i] >= values[i - 1]:
+            return False
+    return True
 
 
 def _get_lookback_extreme(
@@ -450,13 +499,13 @@ def _get_lookback_extreme(
         return None
     if len(df_slice) < n + 1:
         return None
-    window = df_slice[lookback_col].iloc[-(n + 1):-1]
-    if window.isna().all():
+    values = _column_values(df_slice, lookback_col)
+    if values is None:
         return None
-    if mode == "lookback_min":
-        return float(window.min())
-    else:
-        return float(window.max())
+    extreme = _lookback_extreme_kernel(values, int(n), mode == "lookback_min")
+    if math.isnan(extreme):
+        return None
+    return extreme
 
 
 def _get_lookback_value(
@@ -491,15 +540,11 @@ def _evaluate_consecutive(
         return False
     if len(df_slice) < n + 1:
         return False
-    values = df_slice[col_name].iloc[-(n + 1):].values
-    if any(pd.isna(v) for v in values):
+    values = _column_values(df_slice, col_name)
+    if values is None:
         return False
-    for i in range(1, len(values)):
-        if consecutive_type == "rising" and values[i] <= values[i - 1]:
-            return False
-        elif consecutive_type == "falling" and values[i] >= values[i - 1]:
-            return False
-    return True
+    direction = _CONSECUTIVE_DIRECTIONS.get(consecutive_type, 0)
+    return bool(_consecutive_kernel(values, int(n), direction))
 
 
 def _evaluate_pct_diff(
@@ -562,6 +607,7 @@ def evaluate_conditions(
     conditions: List[Dict[str, Any]],
     indicator_df: pd.DataFrame,
     mode: str = "AND",
+    latest: Optional[pd.Series] = None,
 ) -> Tuple[bool, List[str]]:
     """评估一组条件是否满足（用于买入/卖出触发判定）
 
@@ -573,6 +619,7 @@ def evaluate_conditions(
         conditions: 条件列表（格式同 rules，但不需要 score 字段）
         indicator_df: 带指标列的 DataFrame
         mode: "AND"=全部满足才触发, "OR"=任一满足就触发
+        latest: 可选，已取好的 indicator_df.iloc[-1]（多组条件共用时避免重复取行）
 
     Returns:
         (triggered, triggered_labels)
@@ -580,7 +627,8 @@ def evaluate_conditions(
     if not conditions or indicator_df.empty:
         return False, []
 
-    latest = indicator_df.iloc[-1]
+    if latest is None:
+        latest = indicator_df.iloc[-1]
     triggered_labels = []
 
     if mode == "AND":
@@ -612,11 +660,15 @@ from src.factors.registry import get_all_field_ranges as _get_factor_ranges
 FIELD_RANGES: Dict[str, Tuple[float, float]] = _get_factor_ranges()
 
 
+@functools.lru_cache(maxsize=1024)
 def _get_field_range(field: str) -> Optional[Tuple[float, float]]:
     """Get known value range for a field, checking base name if parametrized.
 
     Tries progressively shorter prefixes to handle multi-part field names:
     BOLL_pband_20_2.0 -> BOLL_pband_20 -> BOLL_pband -> BOLL
+
+    Results are memoized per column name; FIELD_RANGES is built once at
+    import, so call _get_field_range.cache_clear() after mutating it.
     """
     if field in FIELD_RANGES:
         return FIELD_RANGES[field]
@@ -636,56 +688,101 @@ def check_reachability(
 
     Returns (True, None) if reachable, (False, reason_string) if contradictory.
     Only checks compare_type="value" conditions — field comparisons are skipped.
+
+    Results are memoized on the value conditions (in order); conditions with
+    unhashable values are checked directly. Call
+    _check_reachability_cached.cache_clear() after changing indicator
+    registries or FIELD_RANGES at runtime.
     """
     if not conditions:
         return True, None
 
-    # Collect per-column bounds: col_name -> {"lower": float, "upper": float}
-    bounds: Dict[str, Dict[str, float]] = {}
+    try:
+        key = _reachability_key(conditions)
+        hash(key)
+    except (TypeError, AttributeError):
+        return _check_reachability_impl(conditions)
+    return _check_reachability_cached(key)
+
+
+def _reachability_key(conditions: List[Dict[str, Any]]) -> tuple:
+    """Hashable form of everything check_reachability reads, order preserved."""
+    key = []
+    for cond in conditions:
+        if cond.get("compare_type", "value") != "value":
+            continue
+        params = cond.get("params")
+        key.append((
+            cond.get("field", ""),
+            cond.get("operator", ">"),
+            cond.get("compare_value", 0),
+            None if params is None else tuple(sorted(params.items())),
+        ))
+    return tuple(key)
+
+
+@functools.lru_cache(maxsize=4096)
+def _check_reachability_cached(key: tuple) -> Tuple[bool, Optional[str]]:
+    conditions = [
+        {
+            "field": field,
+            "operator": operator,
+            "compare_value": value,
+            "params": None if params is None else dict(params),
+        }
+        for field, operator, value, params in key
+    ]
+    return _check_reachability_impl(conditions)
+
+
+def _check_reachability_impl(
+    conditions: List[Dict[str, Any]],
+) -> Tuple[bool, Optional[str]]:
+    # col_name -> [lower, upper]
+    bounds: Dict[str, list] = {}
 
     for cond in conditions:
         compare_type = cond.get("compare_type", "value")
         if compare_type != "value":
             continue  # Skip field/lookback/pct comparisons
 
-        field = cond.get("field", "")
-        params = cond.get("params")
-        col_name = resolve_column_name(field, params)
-        operator = cond.get("operator", ">")
-
         try:
             val = float(cond.get("compare_value", 0))
         except (ValueError, TypeError):
             continue
 
-        if col_name not in bounds:
-            bounds[col_name] = {"lower": float("-inf"), "upper": float("inf")}
+        col_name = resolve_column_name(cond.get("field", ""), cond.get("params"))
+        b = bounds.get(col_name)
+        if b is None:
+            b = bounds[col_name] = [-math.inf, math.inf]
 
-        b = bounds[col_name]
-        if operator in (">", ">="):
-            b["lower"] = max(b["lower"], val)
-        elif operator in ("<", "<="):
-            b["upper"] = min(b["upper"], val)
+        is_lower = _BOUND_SIDE.get(cond.get("operator", ">"))
+        if is_lower is None:
+            continue
+        if is_lower:
+            if val > b[0]:
+                b[0] = val
+        elif val < b[1]:
+            b[1] = val
 
     # Check 1: Range contradiction — lower > upper means impossible
     # Note: lower == upper is valid for single-point ranges (>= X AND <= X)
-    for col_name, b in bounds.items():
-        if b["lower"] > b["upper"]:
-            return False, f"条件矛盾: {col_name} 要求同时 >{b['lower']} 且 <{b['upper']}"
+    for col_name, (lower, upper) in bounds.items():
+        if lower > upper:
+            return False, f"条件矛盾: {col_name} 要求同时 >{lower} 且 <{upper}"
 
     # Check 2: Out-of-range for bounded indicators
-    for col_name, b in bounds.items():
+    for col_name, (lower, upper) in bounds.items():
         field_range = _get_field_range(col_name)
         if not field_range:
             continue
         range_min, range_max = field_range
-
         # Lower bound exceeds indicator max → impossible
-        if b["lower"] != float("-inf") and b["lower"] >= range_max:
-            return False, f"不可达: {col_name} >{b['lower']} 超出取值范围上限{range_max}"
+        if lower != -math.inf and lower >= range_max:
+            return False, f"不可达: {col_name} >{lower} 超出取值范围上限{range_max}"
         # Upper bound below indicator min → impossible
-        if b["upper"] != float("inf") and b["upper"] <= range_min:
-            return False, f"不可达: {col_name} <{b['upper']} 低于取值范围下限{range_min}"
+        if upper != math.inf and upper <= range_min:
+            return False, f"不可达: {col_name} <{upper} 低于取值范围下限{range_min}"
 
     return True, None
 
@@ -702,7 +799,7 @@ def validate_rule(rule: Dict[str, Any]) -> Optional[str]:
         return f"未知指标字段: {field}"
 
     operator = rule.get("operator", "")
-    if operator not in [op[0] for op in OPERATORS]:
+    if operator not in _OPERATOR_SYMBOLS:
         return f"未知运算符: {operator}"
 
     VALID_COMPARE_TYPES = {
@@ -1,17 +1,19 @@
 """Signal combiner: rule-engine driven multi-strategy signal generation."""
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+import numpy as np
 import pandas as pd
 
-from .base_signal import SignalLevel, score_to_signal_level
+from .base_signal import SignalLevel, scores_to_signal_levels
 from .rule_engine import evaluate_rules, evaluate_conditions, collect_indicator_params
 from .action_signal import ActionSignal, SignalAction, SellReason, ExitConfig
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CombinedSignal:
     """Combined signal from multiple strategies.
 
@@ -25,7 +27,7 @@ class CombinedSignal:
         trend_score: Score from second strategy (backward compat)
         ml_score: Score from ML model (optional)
         sentiment_score: Market sentiment score from news (optional)
-        reasons: List of reasons from contributing strategies
+        reasons: Reasons from contributing strategies
         strategy_scores: Dict of strategy_name -> score (new)
     """
     stock_code: str
@@ -37,7 +39,7 @@ class CombinedSignal:
     ml_score: Optional[float]
     stock_name: str = ""
     sentiment_score: Optional[float] = None
-    reasons: list[str] = field(default_factory=list)
+    reasons: tuple[str, ...] = ()
     strategy_scores: dict = field(default_factory=dict)
 
 
@@ -133,106 +135,120 @@ class SignalCombiner:
         Returns:
             CombinedSignal with weighted final score
         """
-        # 用规则引擎评估每个策略
-        strategy_results = []  # [(name, score, weight, reasons)]
-
-        for strategy in self._strategies:
-            rules = strategy.get("rules", [])
-            weight = strategy.get("weight", 0.5)
-            name = strategy.get("name", "未命名")
-
-            score, reasons = evaluate_rules(rules, df)
-            strategy_results.append((name, score, weight, reasons))
+        return self.combine_batch(
+            {stock_code: df},
+            trade_date,
+            ml_scores={stock_code: ml_score},
+            sentiment_score=sentiment_score,
+            market_regime=market_regime,
+        )[0]
 
-        # 收集策略得分和权重
-        scores = []
-        weights = []
-        all_reasons = []
-        strategy_scores = {}
+    def combine_batch(
+        self,
+        stock_data: dict[str, pd.DataFrame],
+        trade_date: str,
+        ml_scores: Optional[dict[str, float]] = None,
+        sentiment_score: Optional[float] = None,
+        market_regime=None
+    ) -> list[CombinedSignal]:
+        """Combine signals for multiple stocks.
 
-        for name, score, weight, reasons in strategy_results:
-            scores.append(score)
-            weights.append(weight)
-            strategy_scores[name] = score
+        Rules are evaluated per stock; the weighted final scores are then
+        computed for all stocks at once over an (N stocks, K sources) score
+        matrix whose columns are the strategies followed by ML and sentiment.
+        A source a stock does not have gets weight 0 in its row.
+        """
+        ml_scores = ml_scores or {}
+        codes = list(stock_data)
+        if not codes:
+            return []
 
-            # 只收集有显著信号的原因
-            if score > 60 or score < 40:
-                for r in reasons:
-                    all_reasons.append(f"[{name}] {r}")
+        n_strategies = len(self._strategies)
+        ml_col, sentiment_col = n_strategies, n_strategies + 1
+        names = [s.get("name", "未命名") for s in self._strategies]
 
         # 市场状态自适应（如果提供且有2个策略）
-        if market_regime is not None and len(weights) >= 2:
-            weights[0] = market_regime.swing_weight
-            weights[1] = market_regime.trend_weight
+        strategy_weights = [s.get("weight", 0.5) for s in self._strategies]
+        if market_regime is not None and n_strategies >= 2:
+            strategy_weights[0] = market_regime.swing_weight
+            strategy_weights[1] = market_regime.trend_weight
+
+        scores = np.zeros((len(codes), n_strategies + 2))
+        weights = np.zeros_like(scores)
+        weights[:, :n_strategies] = strategy_weights
+
+        # 用规则引擎评估每个策略，只收集有显著信号的原因
+        all_reasons: list[list[str]] = []
+        for i, code in enumerate(codes):
+            reasons = []
+            # 最新一行只取一次，所有策略共用
+            df = stock_data[code]
+            latest = df.iloc[-1] if n_strategies and not df.empty else None
+            for j, strategy in enumerate(self._strategies):
+                score, rule_reasons = evaluate_rules(strategy.get("rules", []), df, latest=latest)
+                scores[i, j] = score
+                if score > 60 or score < 40:
+                    # 同一规则原因在各股票间重复出现，驻留后共享同一字符串对象
+                    reasons.extend(sys.intern(f"[{names[j]}] {r}") for r in rule_reasons)
+            all_reasons.append(reasons)
 
         # ML/情绪得分
-        if ml_score is not None:
-            scores.append(ml_score)
-            weights.append(self.ml_weight)
+        has_ml = np.array([ml_scores.get(c) is not None for c in codes])
+        if has_ml.any():
+            scores[has_ml, ml_col] = [ml_scores[c] for c in codes if ml_scores.get(c) is not None]
+            weights[has_ml, ml_col] = self.ml_weight
 
+        sentiment_reason = None
         if sentiment_score is not None:
-            scores.append(sentiment_score)
-            weights.append(self.sentiment_weight)
+            scores[:, sentiment_col] = sentiment_score
+            weights[:, sentiment_col] = self.sentiment_weight
             if sentiment_score > 60:
-                all_reasons.append(f"[情绪] 市场情绪偏多 ({sentiment_score:.0f})")
+                sentiment_reason = f"[情绪] 市场情绪偏多 ({sentiment_score:.0f})"
             elif sentiment_score < 40:
-                all_reasons.append(f"[情绪] 市场情绪偏空 ({sentiment_score:.0f})")
-
-        # 市场状态原因
-        if market_regime is not None and len(weights) >= 2:
-            all_reasons.append(
-                f"[市场] {market_regime.regime_label} "
-                f"(策略1 {weights[0]:.0%}/策略2 {weights[1]:.0%})"
-            )
+                sentiment_reason = f"[情绪] 市场情绪偏空 ({sentiment_score:.0f})"
 
         # 归一化权重并计算最终得分
-        if scores:
-            total_weight = sum(weights)
-            if total_weight > 0:
-                final_score = sum(s * w / total_weight for s, w in zip(scores, weights))
-            else:
-                final_score = 50.0
-        else:
-            final_score = 50.0
-
-        # 向后兼容：swing_score/trend_score 取前两个策略
-        swing_score = strategy_results[0][1] if len(strategy_results) > 0 else 50.0
-        trend_score = strategy_results[1][1] if len(strategy_results) > 1 else 50.0
-
-        return CombinedSignal(
-            stock_code=stock_code,
-            trade_date=trade_date,
-            final_score=final_score,
-            signal_level=score_to_signal_level(final_score),
-            swing_score=swing_score,
-            trend_score=trend_score,
-            ml_score=ml_score,
-            sentiment_score=sentiment_score,
-            reasons=all_reasons,
-            strategy_scores=strategy_scores
-        )
+        total_weight = weights.sum(axis=1)
+        weighted = (scores * weights).sum(axis=1)
+        final_scores = np.full(len(codes), 50.0)
+        np.divide(weighted, total_weight, out=final_scores, where=total_weight > 0)
+        levels = scores_to_signal_levels(final_scores)
 
-    def combine_batch(
-        self,
-        stock_data: dict[str, pd.DataFrame],
-        trade_date: str,
-        ml_scores: Optional[dict[str, float]] = None,
-        sentiment_score: Optional[float] = None,
-        market_regime=None
-    ) -> list[CombinedSignal]:
-        """Combine signals for multiple stocks."""
-        ml_scores = ml_scores or {}
         results = []
+        for i, code in enumerate(codes):
+            reasons = all_reasons[i]
+            if sentiment_reason:
+                reasons.append(sentiment_reason)
+
+            # 市场状态原因（按本行实际参与加权的来源计数）
+            if market_regime is not None:
+                row_weights = [
+                    weights[i, j] for j in range(scores.shape[1])
+                    if j < n_strategies
+                    or (j == ml_col and has_ml[i])
+                    or (j == sentiment_col and sentiment_score is not None)
+                ]
+                if len(row_weights) >= 2:
+                    reasons.append(sys.intern(
+                        f"[市场] {market_regime.regime_label} "
+                        f"(策略1 {row_weights[0]:.0%}/策略2 {row_weights[1]:.0%})"
+                    ))
 
-        for stock_code, df in stock_data.items():
-            ml_score = ml_scores.get(stock_code)
-            signal = self.combine(
-                df, stock_code, trade_date,
+            final_score = float(final_scores[i])
+            ml_score = ml_scores.get(code)
+            results.append(CombinedSignal(
+                stock_code=code,
+                trade_date=trade_date,
+                final_score=final_score,
+                signal_level=levels[i],
+                # 向后兼容：swing_score/trend_score 取前两个策略
+                swing_score=float(scores[i, 0]) if n_strategies > 0 else 50.0,
+                trend_score=float(scores[i, 1]) if n_strategies > 1 else 50.0,
                 ml_score=ml_score,
                 sentiment_score=sentiment_score,
-                market_regime=market_regime
-            )
-            results.append(signal)
+                reasons=tuple(reasons),
+                strategy_scores={names[j]: float(scores[i, j]) for j in range(n_strategies)},
+            ))
 
         return results
 
@@ -256,6 +272,8 @@ class SignalCombiner:
         """
         action_signals = []
         confidence = combined_signal.final_score if combined_signal else 50.0
+        # 最新一行只取一次，所有策略的买卖条件共用
+        latest = df.iloc[-1] if self._strategies and not df.empty else None
 
         for strategy in self._strategies:
             name = strategy.get("name", "未命名")
@@ -263,7 +281,7 @@ class SignalCombiner:
             # 检查买入条件 (AND 逻辑)
             buy_conds = strategy.get("buy_conditions", [])
             if buy_conds:
-                triggered, labels = evaluate_conditions(buy_conds, df, mode="AND")
+                triggered, labels = evaluate_conditions(buy_conds, df, mode="AND", latest=latest)
                 if triggered:
                     # 读取策略级别的退出配置
                     exit_cfg_raw = strategy.get("exit_config", {})
@@ -287,7 +305,7 @@ class SignalCombiner:
             # 检查卖出条件 (OR 逻辑)
             sell_conds = strategy.get("sell_conditions", [])
             if sell_conds:
-                triggered, labels = evaluate_conditions(sell_conds, df, mode="OR")
+                triggered, labels = evaluate_conditions(sell_conds, df, mode="OR", latest=latest)
                 if triggered:
                     action_signals.append(ActionSignal(
                         stock_code=stock_code,
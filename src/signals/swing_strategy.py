@@ -1,8 +1,123 @@
 """Swing trading strategy based on momentum indicators."""
 
+from dataclasses import dataclass, fields
+from typing import Union
+
 import pandas as pd
 
-from .base_signal import BaseStrategy, SignalResult, SignalLevel, score_to_signal_level
+from src.utils.jit import njit
+from .base_signal import (
+    BaseStrategy, SignalResult, SignalLevel, score_to_signal_level, clamp_score, safe_divide,
+)
+
+
+@njit(cache=True)
+def _rsi_score(rsi, oversold, overbought):
+    """Calculate RSI contribution to signal score.
+
+    Oversold (RSI < 30) -> high score (bullish reversal expected)
+    Overbought (RSI > 70) -> low score (bearish reversal expected)
+    Neutral (30-70) -> maps to 40-60 score range
+
+    Returns:
+        Score 0-100
+    """
+    if rsi <= oversold:
+        # Oversold: more oversold = higher score
+        # RSI 0 -> score 100, RSI 30 -> score 70
+        return 100 - safe_divide(rsi, oversold) * 30
+    elif rsi >= overbought:
+        # Overbought: more overbought = lower score
+        # RSI 70 -> score 30, RSI 100 -> score 0
+        score = 30 - (rsi - overbought)
+        return score if score > 0 else 0.0
+    else:
+        # Neutral zone: linear mapping from 30-70 RSI to 40-60 score
+        normalized = (rsi - oversold) / (overbought - oversold)
+        return 60 - normalized * 20  # 60 at RSI 30, 40 at RSI 70
+
+
+@njit(cache=True)
+def _kdj_score(k, d, j):
+    """Calculate KDJ contribution to signal score.
+
+    K > D (golden cross tendency) -> bullish
+    K < D (death cross tendency) -> bearish
+    J extremes amplify the signal
+
+    Returns:
+        Score 0-100
+    """
+    # Base score from K-D difference
+    diff = k - d
+    # Map diff (-40 to +40 typical range) to score
+    base_score = 50 + diff * 0.5  # diff of +20 -> score 60
+
+    # J extremes as amplifier
+    if j > 100:
+        # Overbought J, reduce score
+        base_score -= (j - 100) * 0.2
+    elif j < 0:
+        # Oversold J, increase score
+        base_score += abs(j) * 0.2
+
+    return clamp_score(base_score)
+
+
+@njit(cache=True)
+def _macd_score(histogram):
+    """Calculate MACD histogram contribution to signal score.
+
+    Positive histogram -> bullish momentum
+    Negative histogram -> bearish momentum
+
+    Returns:
+        Score 0-100
+    """
+    # Map histogram to score
+    # Typical range -2 to +2, map to 0-100
+    return clamp_score(50 + histogram * 25)
+
+
+@njit(cache=True)
+def _swing_score_kernel(
+    rsi, kdj_k, kdj_d, kdj_j, macd_hist,
+    rsi_weight, kdj_weight, macd_weight,
+    rsi_oversold, rsi_overbought,
+):
+    """Weighted swing score for one row.
+
+    Returns:
+        (total_score, rsi_score, kdj_score, macd_score)
+    """
+    rsi_score = _rsi_score(rsi, rsi_oversold, rsi_overbought)
+    kdj_score = _kdj_score(kdj_k, kdj_d, kdj_j)
+    macd_score = _macd_score(macd_hist)
+    total_score = (
+        rsi_score * rsi_weight +
+        kdj_score * kdj_weight +
+        macd_score * macd_weight
+    )
+    return total_score, rsi_score, kdj_score, macd_score
+
+
+@dataclass(frozen=True, slots=True)
+class SwingRow:
+    """Indicator values SwingStrategy scores for a single bar."""
+    RSI: float
+    KDJ_K: float
+    KDJ_D: float
+    KDJ_J: float
+    MACD_hist: float
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SwingRow":
+        """Take the latest row of an indicator DataFrame."""
+        return cls(*(df[col].iat[-1] for col in _SWING_COLUMNS))
+
+
+# DataFrame columns in SwingRow field order
+_SWING_COLUMNS = tuple(f.name for f in fields(SwingRow))
 
 
 class SwingStrategy(BaseStrategy):
@@ -54,14 +169,15 @@ class SwingStrategy(BaseStrategy):
 
     def generate_signals(
         self,
-        df: pd.DataFrame,
+        df: Union[pd.DataFrame, SwingRow],
         stock_code: str,
         trade_date: str
     ) -> SignalResult:
         """Generate swing trading signal.
 
         Args:
-            df: DataFrame with RSI, KDJ_K, KDJ_D, KDJ_J, MACD_hist columns
+            df: DataFrame with RSI, KDJ_K, KDJ_D, KDJ_J, MACD_hist columns,
+                or a SwingRow holding the latest values directly
             stock_code: Stock identifier
             trade_date: Signal date
 
@@ -69,30 +185,28 @@ class SwingStrategy(BaseStrategy):
             SignalResult with swing trading signal
         """
         # Get latest values
-        latest = df.iloc[-1]
-
-        # Calculate component scores (0-100 scale)
-        rsi_score = self._calculate_rsi_score(latest["RSI"])
-        kdj_score = self._calculate_kdj_score(
-            latest["KDJ_K"],
-            latest["KDJ_D"],
-            latest["KDJ_J"]
-        )
-        macd_score = self._calculate_macd_score(latest["MACD_hist"])
-
-        # Weighted combination
-        total_score = (
-            rsi_score * self.rsi_weight +
-            kdj_score * self.kdj_weight +
-            macd_score * self.macd_weight
+        latest = df if isinstance(df, SwingRow) else SwingRow.from_frame(df)
+
+        # Calculate weighted and component scores (0-100 scale)
+        total_score, rsi_score, kdj_score, macd_score = _swing_score_kernel(
+            float(latest.RSI),
+            float(latest.KDJ_K),
+            float(latest.KDJ_D),
+            float(latest.KDJ_J),
+            float(latest.MACD_hist),
+            self.rsi_weight,
+            self.kdj_weight,
+            self.macd_weight,
+            self.rsi_oversold,
+            self.rsi_overbought,
         )
 
         # Build reason string
         reasons = []
         if rsi_score > 60:
-            reasons.append(f"RSI超卖反弹({latest['RSI']:.1f})")
+            reasons.append(f"RSI超卖反弹({latest.RSI:.1f})")
         elif rsi_score < 40:
-            reasons.append(f"RSI超买回调({latest['RSI']:.1f})")
+            reasons.append(f"RSI超买回调({latest.RSI:.1f})")
 
         if kdj_score > 60:
             reasons.append("KDJ金叉")
@@ -117,83 +231,21 @@ class SwingStrategy(BaseStrategy):
                 "rsi_score": rsi_score,
                 "kdj_score": kdj_score,
                 "macd_score": macd_score,
-                "rsi": latest["RSI"],
-                "kdj_k": latest["KDJ_K"],
-                "kdj_d": latest["KDJ_D"],
-                "macd_hist": latest["MACD_hist"]
+                "rsi": latest.RSI,
+                "kdj_k": latest.KDJ_K,
+                "kdj_d": latest.KDJ_D,
+                "macd_hist": latest.MACD_hist
             }
         )
 
-    def _calculate_rsi_score(self, rsi: float) -> float:
-        """Calculate RSI contribution to signal score.
-
-        Oversold (RSI < 30) -> high score (bullish reversal expected)
-        Overbought (RSI > 70) -> low score (bearish reversal expected)
-        Neutral (30-70) -> maps to 40-60 score range
-
-        Args:
-            rsi: Current RSI value
-
-        Returns:
-            Score 0-100
-        """
-        if rsi <= self.rsi_oversold:
-            # Oversold: more oversold = higher score
-            # RSI 0 -> score 100, RSI 30 -> score 70
-            return 100 - (rsi / self.rsi_oversold) * 30
-        elif rsi >= self.rsi_overbought:
-            # Overbought: more overbought = lower score
-            # RSI 70 -> score 30, RSI 100 -> score 0
-            excess = rsi - self.rsi_overbought
-            return max(0, 30 - excess)
-        else:
-            # Neutral zone: linear mapping from 30-70 RSI to 40-60 score
-            normalized = (rsi - self.rsi_oversold) / (self.rsi_overbought - self.rsi_oversold)
-            return 60 - normalized * 20  # 60 at RSI 30, 40 at RSI 70
-
-    def _calculate_kdj_score(self, k: float, d: float, j: float) -> float:
-        """Calculate KDJ contribution to signal score.
-
-        K > D (golden cross tendency) -> bullish
-        K < D (death cross tendency) -> bearish
-        J extremes amplify the signal
-
-        Args:
-            k: KDJ K value
-            d: KDJ D value
-            j: KDJ J value
-
-        Returns:
-            Score 0-100
-        """
-        # Base score from K-D difference
-        diff = k - d
-        # Map diff (-40 to +40 typical range) to score
-        base_score = 50 + diff * 0.5  # diff of +20 -> score 60
-
-        # J extremes as amplifier
-        if j > 100:
-            # Overbought J, reduce score
-            base_score -= (j - 100) * 0.2
-        elif j < 0:
-            # Oversold J, increase score
-            base_score += abs(j) * 0.2
-
-        return max(0, min(100, base_score))
+    # Bind directly instead of going through BaseStrategy.__call__
+    __call__ = generate_signals
 
-    def _calculate_macd_score(self, histogram: float) -> float:
-        """Calculate MACD histogram contribution to signal score.
 
-        Positive histogram -> bullish momentum
-        Negative histogram -> bearish momentum
+# Shared instance with default parameters; strategies hold no per-call state.
+DEFAULT_SWING = SwingStrategy()
 
-        Args:
-            histogram: MACD histogram value
 
-        Returns:
-            Score 0-100
-        """
-        # Map histogram to score
-        # Typical range -2 to +2, map to 0-100
-        score = 50 + histogram * 25
-        return max(0, min(100, score))
+def get_default() -> SwingStrategy:
+    """Return the shared SwingStrategy with default parameters."""
+    return DEFAULT_SWING
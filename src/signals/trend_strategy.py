@@ -1,8 +1,155 @@
 """Trend following strategy based on moving averages and ADX."""
 
+from dataclasses import dataclass, fields
+from typing import Union
+
 import pandas as pd
 
-from .base_signal import BaseStrategy, SignalResult, SignalLevel, score_to_signal_level
+from src.utils.jit import njit
+from .base_signal import (
+    BaseStrategy, SignalResult, SignalLevel, score_to_signal_level, clamp_score, safe_divide,
+)
+
+
+@njit(cache=True)
+def _ma_score(close, ma_short, ma_long):
+    """Calculate MA crossover contribution to signal score.
+
+    Short MA above long MA -> bullish
+    Price position relative to MAs adds confirmation
+
+    Returns:
+        Score 0-100
+    """
+    # MA relationship
+    ma_diff_pct = safe_divide(ma_short - ma_long, ma_long) * 100
+
+    # Map percentage diff to score
+    # +5% diff -> score 80, -5% diff -> score 20
+    base_score = clamp_score(50 + ma_diff_pct * 6)
+
+    # Price position modifier
+    price_vs_short = safe_divide(close - ma_short, ma_short) * 100
+    modifier = clamp_score(price_vs_short * 2, -10.0, 10.0)  # +2% above MA -> +4 points
+
+    return clamp_score(base_score + modifier)
+
+
+@njit(cache=True)
+def _adx_score(adx, plus_di, minus_di, adx_threshold):
+    """Calculate ADX/DI contribution to signal score.
+
+    +DI > -DI -> bullish direction
+    ADX strength amplifies the direction signal
+
+    Returns:
+        Score 0-100
+    """
+    # Direction from DI difference
+    di_diff = plus_di - minus_di
+
+    # Base score from DI difference
+    # +20 DI diff -> score 70, -20 DI diff -> score 30
+    base_score = 50 + di_diff
+
+    # Weak trend (low ADX) -> push towards neutral
+    if adx < adx_threshold:
+        weakness_factor = safe_divide(adx, adx_threshold)
+        base_score = 50 + (base_score - 50) * weakness_factor
+
+    return clamp_score(base_score)
+
+
+@njit(cache=True)
+def _ema_score(close, ema_12, ema_26):
+    """Calculate EMA alignment contribution to signal score.
+
+    Price > EMA12 > EMA26 -> bullish alignment
+    Price < EMA12 < EMA26 -> bearish alignment
+
+    Returns:
+        Score 0-100
+    """
+    # EMA relationship
+    ema_bullish = ema_12 > ema_26
+    ema_diff_pct = safe_divide(abs(ema_12 - ema_26), ema_26) * 100
+    ema_bonus = ema_diff_pct * 5
+    if not ema_bonus < 30:
+        ema_bonus = 30.0
+
+    # Price position
+    price_above_ema12 = close > ema_12
+    price_above_ema26 = close > ema_26
+
+    # Scoring
+    if ema_bullish and price_above_ema12 and price_above_ema26:
+        # Full bullish alignment
+        return 70 + ema_bonus
+    elif not ema_bullish and not price_above_ema12 and not price_above_ema26:
+        # Full bearish alignment
+        return 30 - ema_bonus
+    elif price_above_ema12 and price_above_ema26:
+        # Price bullish, EMAs mixed
+        return 60.0
+    elif not price_above_ema12 and not price_above_ema26:
+        # Price bearish, EMAs mixed
+        return 40.0
+    else:
+        # Mixed signals
+        return 50.0
+
+
+@njit(cache=True)
+def _trend_score_kernel(
+    close, ma_short, ma_long, ema_12, ema_26, adx, plus_di, minus_di,
+    ma_weight, adx_weight, ema_weight, adx_threshold,
+):
+    """Weighted trend score for one row, amplified in strong trends.
+
+    Returns:
+        (total_score, ma_score, adx_score, ema_score)
+    """
+    ma_score = _ma_score(close, ma_short, ma_long)
+    adx_score = _adx_score(adx, plus_di, minus_di, adx_threshold)
+    ema_score = _ema_score(close, ema_12, ema_26)
+
+    # Weighted combination
+    total_score = (
+        ma_score * ma_weight +
+        adx_score * adx_weight +
+        ema_score * ema_weight
+    )
+
+    # ADX strength modifier - amplify signals in strong trends
+    if adx > adx_threshold:
+        # Amplify deviation from neutral
+        deviation = total_score - 50
+        amplification = 1 + (adx - adx_threshold) / 50
+        total_score = clamp_score(50 + deviation * amplification)
+
+    return total_score, ma_score, adx_score, ema_score
+
+
+@dataclass(frozen=True, slots=True)
+class TrendRow:
+    """Indicator values TrendStrategy scores for a single bar."""
+    close: float
+    MA_5: float
+    MA_20: float
+    EMA_12: float
+    EMA_26: float
+    ADX: float
+    ADX_plus_di: float
+    ADX_minus_di: float
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "TrendRow":
+        """Take the latest row of an indicator DataFrame."""
+        return cls(*(df[col].iat[-1] for col in _TREND_COLUMNS))
+
+
+# DataFrame columns in TrendRow field order
+_TREND_COLUMNS = tuple(f.name for f in fields(TrendRow))
 
 
 class TrendStrategy(BaseStrategy):
@@ -50,7 +197,7 @@ class TrendStrategy(BaseStrategy):
 
     def generate_signals(
         self,
-        df: pd.DataFrame,
+        df: Union[pd.DataFrame, TrendRow],
         stock_code: str,
         trade_date: str
     ) -> SignalResult:
@@ -58,7 +205,8 @@ class TrendStrategy(BaseStrategy):
 
         Args:
             df: DataFrame with MA_5, MA_20, EMA_12, EMA_26, ADX,
-                ADX_plus_di, ADX_minus_di columns
+                ADX_plus_di, ADX_minus_di columns, or a TrendRow holding
+                the latest values directly
             stock_code: Stock identifier
             trade_date: Signal date
 
@@ -66,40 +214,24 @@ class TrendStrategy(BaseStrategy):
             SignalResult with trend following signal
         """
         # Get latest values
-        latest = df.iloc[-1]
-
-        # Calculate component scores (0-100 scale)
-        ma_score = self._calculate_ma_score(
-            latest["close"],
-            latest["MA_5"],
-            latest["MA_20"]
-        )
-        adx_score = self._calculate_adx_score(
-            latest["ADX"],
-            latest["ADX_plus_di"],
-            latest["ADX_minus_di"]
-        )
-        ema_score = self._calculate_ema_score(
-            latest["close"],
-            latest["EMA_12"],
-            latest["EMA_26"]
-        )
-
-        # Weighted combination
-        total_score = (
-            ma_score * self.ma_weight +
-            adx_score * self.adx_weight +
-            ema_score * self.ema_weight
+        latest = df if isinstance(df, TrendRow) else TrendRow.from_frame(df)
+
+        # Calculate weighted and component scores (0-100 scale)
+        total_score, ma_score, adx_score, ema_score = _trend_score_kernel(
+            float(latest.close),
+            float(latest.MA_5),
+            float(latest.MA_20),
+            float(latest.EMA_12),
+            float(latest.EMA_26),
+            float(latest.ADX),
+            float(latest.ADX_plus_di),
+            float(latest.ADX_minus_di),
+            self.ma_weight,
+            self.adx_weight,
+            self.ema_weight,
+            self.adx_threshold,
         )
 
-        # ADX strength modifier - amplify signals in strong trends
-        if latest["ADX"] > self.adx_threshold:
-            # Amplify deviation from neutral
-            deviation = total_score - 50
-            amplification = 1 + (latest["ADX"] - self.adx_threshold) / 50
-            total_score = 50 + deviation * amplification
-            total_score = max(0, min(100, total_score))
-
         # Build reason string
         reasons = []
         if ma_score > 60:
@@ -107,13 +239,13 @@ class TrendStrategy(BaseStrategy):
         elif ma_score < 40:
             reasons.append("MA死叉(短期MA在长期MA之下)")
 
-        if latest["ADX"] > self.adx_threshold:
-            if latest["ADX_plus_di"] > latest["ADX_minus_di"]:
-                reasons.append(f"强势上涨趋势(ADX={latest['ADX']:.1f})")
+        if latest.ADX > self.adx_threshold:
+            if latest.ADX_plus_di > latest.ADX_minus_di:
+                reasons.append(f"强势上涨趋势(ADX={latest.ADX:.1f})")
             else:
-                reasons.append(f"强势下跌趋势(ADX={latest['ADX']:.1f})")
+                reasons.append(f"强势下跌趋势(ADX={latest.ADX:.1f})")
         else:
-            reasons.append(f"趋势较弱(ADX={latest['ADX']:.1f})")
+            reasons.append(f"趋势较弱(ADX={latest.ADX:.1f})")
 
         if ema_score > 60:
             reasons.append("价格在EMA之上")
@@ -133,119 +265,20 @@ class TrendStrategy(BaseStrategy):
                 "ma_score": ma_score,
                 "adx_score": adx_score,
                 "ema_score": ema_score,
-                "adx": latest["ADX"],
-                "plus_di": latest["ADX_plus_di"],
-                "minus_di": latest["ADX_minus_di"]
+                "adx": latest.ADX,
+                "plus_di": latest.ADX_plus_di,
+                "minus_di": latest.ADX_minus_di
             }
         )
 
-    def _calculate_ma_score(
-        self,
-        close: float,
-        ma_short: float,
-        ma_long: float
-    ) -> float:
-        """Calculate MA crossover contribution to signal score.
-
-        Short MA above long MA -> bullish
-        Price position relative to MAs adds confirmation
-
-        Args:
-            close: Current close price
-            ma_short: Short-term MA value
-            ma_long: Long-term MA value
-
-        Returns:
-            Score 0-100
-        """
-        # MA relationship
-        ma_diff_pct = (ma_short - ma_long) / ma_long * 100
+    # Bind directly instead of going through BaseStrategy.__call__
+    __call__ = generate_signals
 
-        # Map percentage diff to score
-        # +5% diff -> score 80, -5% diff -> score 20
-        base_score = 50 + ma_diff_pct * 6
-        base_score = max(0, min(100, base_score))
 
-        # Price position modifier
-        price_vs_short = (close - ma_short) / ma_short * 100
-        modifier = price_vs_short * 2  # +2% above MA -> +4 points
-        modifier = max(-10, min(10, modifier))
+# Shared instance with default parameters; strategies hold no per-call state.
+DEFAULT_TREND = TrendStrategy()
 
-        return max(0, min(100, base_score + modifier))
 
-    def _calculate_adx_score(
-        self,
-        adx: float,
-        plus_di: float,
-        minus_di: float
-    ) -> float:
-        """Calculate ADX/DI contribution to signal score.
-
-        +DI > -DI -> bullish direction
-        ADX strength amplifies the direction signal
-
-        Args:
-            adx: ADX value (trend strength)
-            plus_di: +DI value (bullish pressure)
-            minus_di: -DI value (bearish pressure)
-
-        Returns:
-            Score 0-100
-        """
-        # Direction from DI difference
-        di_diff = plus_di - minus_di
-
-        # Base score from DI difference
-        # +20 DI diff -> score 70, -20 DI diff -> score 30
-        base_score = 50 + di_diff
-
-        # Weak trend (low ADX) -> push towards neutral
-        if adx < self.adx_threshold:
-            weakness_factor = adx / self.adx_threshold
-            base_score = 50 + (base_score - 50) * weakness_factor
-
-        return max(0, min(100, base_score))
-
-    def _calculate_ema_score(
-        self,
-        close: float,
-        ema_12: float,
-        ema_26: float
-    ) -> float:
-        """Calculate EMA alignment contribution to signal score.
-
-        Price > EMA12 > EMA26 -> bullish alignment
-        Price < EMA12 < EMA26 -> bearish alignment
-
-        Args:
-            close: Current close price
-            ema_12: 12-period EMA
-            ema_26: 26-period EMA
-
-        Returns:
-            Score 0-100
-        """
-        # EMA relationship
-        ema_bullish = ema_12 > ema_26
-        ema_diff_pct = abs(ema_12 - ema_26) / ema_26 * 100
-
-        # Price position
-        price_above_ema12 = close > ema_12
-        price_above_ema26 = close > ema_26
-
-        # Scoring
-        if ema_bullish and price_above_ema12 and price_above_ema26:
-            # Full bullish alignment
-            return 70 + min(30, ema_diff_pct * 5)
-        elif not ema_bullish and not price_above_ema12 and not price_above_ema26:
-            # Full bearish alignment
-            return 30 - min(30, ema_diff_pct * 5)
-        elif price_above_ema12 and price_above_ema26:
-            # Price bullish, EMAs mixed
-            return 60
-        elif not price_above_ema12 and not price_above_ema26:
-            # Price bearish, EMAs mixed
-            return 40
-        else:
-            # Mixed signals
-            return 50
+def get_default() -> TrendStrategy:
+    """Return the shared TrendStrategy with default parameters."""
+    return DEFAULT_TREND
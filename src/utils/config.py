@@ -1,14 +1,44 @@
 """配置文件加载和管理模块"""
+import copy
 import os
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterator, Optional, Tuple
 import yaml
 
+# 有 libyaml 时使用C实现的解析器
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigError(Exception):
     """配置相关错误"""
     pass
 
 
+def _iter_flat(data: dict, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """遍历嵌套字典，产出 ("a.b.c", value)
+
+    每一层的节点都会产出（中间层的值是子字典本身），列表等非字典值不再展开。
+    """
+    for k, v in data.items():
+        if not isinstance(k, str):
+            continue
+        path = prefix + k
+        yield path, v
+        if isinstance(v, dict):
+            yield from _iter_flat(v, path + ".")
+
+
+@lru_cache(maxsize=16)
+def _load_yaml(config_path: str, mtime_ns: int, size: int) -> dict:
+    """解析YAML配置文件
+
+    以 (路径, 修改时间, 大小) 为key缓存，文件未变化时不重复解析。
+    调用方需自行复制返回值，不能原地修改。
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 class Config:
     """配置管理器
 
@@ -35,15 +65,20 @@ class Config:
             raise ConfigError(f"配置文件不存在: {config_path}")
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                self._data = yaml.safe_load(f) or {}
+            stat = os.stat(config_path)
+            # 缓存的解析结果在实例间共享，复制一份以免 set() 互相影响
+            self._data = copy.deepcopy(
+                _load_yaml(config_path, stat.st_mtime_ns, stat.st_size)
+            )
         except yaml.YAMLError as e:
             raise ConfigError(f"配置文件格式错误: {e}")
+        self._flat = dict(_iter_flat(self._data))
 
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         """获取配置值
 
-        支持点分隔的嵌套key，如 "tushare.token"
+        支持点分隔的嵌套key，如 "tushare.token"。加载时已展开为扁平字典，
+        查询只需一次字典查找。
 
         Args:
             key: 配置key，支持点分隔
@@ -52,16 +87,7 @@ class Config:
         Returns:
             配置值或默认值
         """
-        keys = key.split(".")
-        value = self._data
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        return self._flat.get(key, default)
 
     def __getitem__(self, key: str) -> Any:
         """支持字典式访问"""
@@ -90,6 +116,7 @@ class Config:
 
         # 设置最后一层的值
         data[keys[-1]] = value
+        self._flat = dict(_iter_flat(self._data))
 
     def save(self) -> None:
         """保存配置到文件
@@ -0,0 +1,28 @@
+"""Optional Numba JIT decorator.
+
+Modules decorate their numeric kernels with ``njit`` from here so they still
+import (and run as plain Python) when numba is not installed.
+"""
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def njit(*args, **kwargs):
+    """``numba.njit`` when available, otherwise a no-op decorator.
+
+    Supports both ``@njit`` and ``@njit(signature, cache=True, ...)`` forms.
+    """
+    if HAS_NUMBA:
+        return numba.njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func):
+        return func
+
+    return decorator
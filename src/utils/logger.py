@@ -14,6 +14,7 @@ def setup_logger(
     level: str = "INFO",
     rotation: str = "10 MB",
     retention: str = "30 days",
+    enqueue: bool = True,
 ) -> None:
     """配置日志系统
 
@@ -22,6 +23,7 @@ def setup_logger(
         level: 日志级别 (DEBUG, INFO, WARNING, ERROR)
         rotation: 日志轮转大小
         retention: 日志保留时间
+        enqueue: 文件输出是否经队列交给后台线程写入，调用方不阻塞在磁盘IO上
     """
     global _initialized
 
@@ -43,11 +45,17 @@ def setup_logger(
         rotation=rotation,
         retention=retention,
         encoding="utf-8",
+        enqueue=enqueue,
     )
 
     _initialized = True
 
 
+def flush_logs() -> None:
+    """等待队列中尚未写出的日志全部落盘"""
+    logger.complete()
+
+
 def get_logger(name: str):
     """获取命名logger
 
@@ -0,0 +1,50 @@
+"""客户端限流工具"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """线程安全的令牌桶限流器
+
+    以 rate_per_sec 的速度补充令牌，最多积攒 burst 个。每次 acquire 取走一个令牌，
+    令牌不足时预约下一个令牌并睡眠到其可用时刻，多个线程共享同一个桶时
+    总请求速率不会超过 rate_per_sec。
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        """初始化令牌桶
+
+        Args:
+            rate_per_sec: 每秒补充的令牌数
+            burst: 桶容量，即空闲后允许连续放行的请求数
+        """
+        if rate_per_sec <= 0:
+            raise ValueError(f"rate_per_sec 必须为正数: {rate_per_sec}")
+        if burst < 1:
+            raise ValueError(f"burst 至少为1: {burst}")
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """取一个令牌，必要时阻塞
+
+        Returns:
+            实际等待的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate_per_sec
+            )
+            self._updated = now
+            # 令牌可为负数：表示已被预约，后来者排在其后
+            self._tokens -= 1
+            wait = -self._tokens / self.rate_per_sec if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,143 @@
+"""Shared fixtures for signal tests."""
+
+import functools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.signals.daily_signal_generator import DailySignalGenerator
+from src.signals.rule_engine import _column_values, _consecutive_kernel, _lookback_extreme_kernel
+from src.signals.swing_strategy import _swing_score_kernel
+from src.signals.trend_strategy import _trend_score_kernel
+
+# Latest-bar indicator values where swing and trend both point one way
+_BULLISH_ROW = {
+    "close": 120.0,
+    # Swing: oversold RSI, KDJ golden cross, positive MACD
+    "RSI": 25.0, "KDJ_K": 70.0, "KDJ_D": 30.0, "KDJ_J": 150.0, "MACD_hist": 0.8,
+    # Trend: MA golden cross, strong uptrend
+    "MA_5": 118.0, "MA_20": 110.0, "EMA_12": 116.0, "EMA_26": 112.0,
+    "ADX": 35.0, "ADX_plus_di": 35.0, "ADX_minus_di": 15.0,
+}
+_BEARISH_ROW = {
+    "close": 80.0,
+    # Swing: overbought RSI, KDJ death cross, negative MACD
+    "RSI": 75.0, "KDJ_K": 30.0, "KDJ_D": 70.0, "KDJ_J": -50.0, "MACD_hist": -0.8,
+    # Trend: MA death cross, strong downtrend
+    "MA_5": 82.0, "MA_20": 90.0, "EMA_12": 84.0, "EMA_26": 88.0,
+    "ADX": 35.0, "ADX_plus_di": 15.0, "ADX_minus_di": 35.0,
+}
+
+
+class _IndicatorRequest:
+    """One _calculate_indicators call, hashed and compared by its cache key.
+
+    The key is (indicator config repr, columns, row-content hash), so
+    lru_cache can memoize on it without hashing the DataFrame itself.
+    """
+
+    __slots__ = ("key", "compute", "generator", "df")
+
+    def __init__(self, compute, generator, df):
+        self.key = (
+            repr(generator.indicator_calculator.config),
+            tuple(df.columns),
+            int(pd.util.hash_pandas_object(df).sum()),
+        )
+        self.compute = compute
+        self.generator = generator
+        self.df = df
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_indicators(request: _IndicatorRequest) -> pd.DataFrame:
+    return request.compute(request.generator, request.df)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_jit():
+    """Compile (or load from numba's cache) every scoring kernel up front.
+
+    Without numba these are plain functions and the calls cost nothing.
+    The rule-engine kernels get an array from _column_values so they are
+    specialised for the same array type the real calls pass in.
+    """
+    _swing_score_kernel(50.0, 50.0, 50.0, 50.0, 0.0, 0.35, 0.35, 0.30, 30.0, 70.0)
+    _trend_score_kernel(
+        100.0, 100.0, 100.0, 100.0, 100.0, 25.0, 25.0, 25.0, 0.35, 0.35, 0.30, 25.0,
+    )
+    values = _column_values(pd.DataFrame({"close": [1.0, 2.0, 3.0]}), "close")
+    _lookback_extreme_kernel(values, 2, True)
+    _consecutive_kernel(values, 2, 1)
+
+
+@pytest.fixture(autouse=True)
+def _cache_indicators(monkeypatch):
+    """Memoize DailySignalGenerator._calculate_indicators across tests.
+
+    Most generator tests feed the same seeded OHLCV frame, so the indicator
+    pipeline only needs to run once per (config, content) pair; the cache
+    keeps the 8 most recent results. Callers get a copy so a test that
+    mutates the result cannot poison later hits.
+    """
+    orig = DailySignalGenerator._calculate_indicators
+
+    def wrapped(self, df):
+        return _cached_indicators(_IndicatorRequest(orig, self, df)).copy()
+
+    monkeypatch.setattr(DailySignalGenerator, "_calculate_indicators", wrapped)
+
+
+@pytest.fixture(scope="session")
+def sample_ohlcv_with_indicators():
+    """Sample OHLCV data with pre-calculated swing and trend indicators.
+
+    Built once per session and shared read-only; tests that need to modify
+    it must take a .copy() first.
+    """
+    rng = np.random.default_rng(42)
+    n = 50
+    f32 = np.float32
+    # One draw for every random column; row i feeds column i below
+    (step, open_gap, high_gap, low_gap, volume, rsi, kdj_k, kdj_d, kdj_j,
+     macd_hist, adx, plus_di, minus_di) = rng.random((13, n), dtype=f32)
+    close = 100 + np.cumsum((step - f32(0.5)) * 4)
+    data = {
+        "open": close - open_gap,
+        "high": close + high_gap * 2,
+        "low": close - low_gap * 2,
+        "close": close,
+        "volume": np.floor(1000 + volume * 9000),
+        # Swing strategy indicators
+        "RSI": 30 + rsi * 40,
+        "KDJ_K": 20 + kdj_k * 60,
+        "KDJ_D": 20 + kdj_d * 60,
+        "KDJ_J": kdj_j * 100,
+        "MACD_hist": macd_hist * 2 - 1,
+        # Trend strategy indicators
+        "MA_5": close - f32(1),
+        "MA_20": close - f32(2),
+        "EMA_12": close - f32(0.5),
+        "EMA_26": close - f32(1.5),
+        "ADX": 15 + adx * 25,
+        "ADX_plus_di": 20 + plus_di * 15,
+        "ADX_minus_di": 15 + minus_di * 15,
+    }
+    return pd.DataFrame(data, copy=False)
+
+
+@pytest.fixture(
+    params=[(_BULLISH_ROW, "is_bullish"), (_BEARISH_ROW, "is_bearish")],
+    ids=["bullish", "bearish"],
+)
+def directional_row(request):
+    """One-row indicator DataFrame plus the SignalLevel check it should pass."""
+    row, check = request.param
+    return pd.DataFrame({col: [value] for col, value in row.items()}), check
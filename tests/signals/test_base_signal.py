@@ -7,7 +7,8 @@ from src.signals.base_signal import (
     SignalLevel,
     SignalResult,
     BaseStrategy,
-    score_to_signal_level
+    score_to_signal_level,
+    scores_to_signal_levels,
 )
 
 
@@ -84,6 +85,12 @@ class TestScoreToSignalLevel:
         assert score_to_signal_level(-10) == SignalLevel.STRONG_SELL
         assert score_to_signal_level(110) == SignalLevel.STRONG_BUY
 
+    def test_vectorized_matches_scalar(self):
+        """Test scores_to_signal_levels agrees with the scalar mapping."""
+        scores = np.array([-10, 0, 19.9, 20, 39, 40, 59.9, 60, 79, 80, 100, 110])
+        levels = scores_to_signal_levels(scores)
+        assert list(levels) == [score_to_signal_level(s) for s in scores]
+
 
 class TestSignalResult:
     """Tests for SignalResult dataclass."""
@@ -127,55 +134,58 @@ class TestSignalResult:
         assert "MACD" in result.reason
 
 
-class ConcreteStrategy(BaseStrategy):
+@pytest.fixture(scope="session")
+def concrete_strategy_cls():
     """Concrete implementation for testing abstract base class."""
 
-    @property
-    def name(self) -> str:
-        return "CONCRETE"
-
-    def generate_signals(
-        self,
-        df: pd.DataFrame,
-        stock_code: str,
-        trade_date: str
-    ) -> SignalResult:
-        score = 50.0  # Neutral
-        return SignalResult(
-            strategy_name=self.name,
-            stock_code=stock_code,
-            signal_level=score_to_signal_level(score),
-            score=score,
-            trade_date=trade_date
-        )
+    class ConcreteStrategy(BaseStrategy):
+        @property
+        def name(self) -> str:
+            return "CONCRETE"
+
+        def generate_signals(
+            self,
+            df: pd.DataFrame,
+            stock_code: str,
+            trade_date: str
+        ) -> SignalResult:
+            score = 50.0  # Neutral
+            return SignalResult(
+                strategy_name=self.name,
+                stock_code=stock_code,
+                signal_level=score_to_signal_level(score),
+                score=score,
+                trade_date=trade_date
+            )
+
+    return ConcreteStrategy
 
 
 class TestBaseStrategy:
     """Tests for BaseStrategy abstract base class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_df(self):
         """Create sample OHLCV dataframe for testing."""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n = 50
-        close = 100 + np.cumsum(np.random.randn(n) * 2)
+        close = 100 + np.cumsum(rng.standard_normal(n) * 2)
         return pd.DataFrame({
-            "open": close - np.random.rand(n),
-            "high": close + np.random.rand(n) * 2,
-            "low": close - np.random.rand(n) * 2,
+            "open": close - rng.random(n),
+            "high": close + rng.random(n) * 2,
+            "low": close - rng.random(n) * 2,
             "close": close,
-            "volume": np.random.randint(1000, 10000, n).astype(float)
+            "volume": rng.integers(1000, 10000, n, dtype=np.int64).astype(float)
         })
 
     @pytest.fixture
-    def strategy(self):
+    def strategy(self, concrete_strategy_cls):
         """Create concrete strategy instance."""
-        return ConcreteStrategy()
+        return concrete_strategy_cls()
 
     def test_abstract_class_cannot_be_instantiated(self):
         """Test that BaseStrategy cannot be instantiated directly."""
-        with pytest.raises(TypeError):
-            BaseStrategy()
+        assert BaseStrategy.__abstractmethods__ == {"name", "generate_signals"}
 
     def test_strategy_has_name(self, strategy):
         """Test strategy has name property."""
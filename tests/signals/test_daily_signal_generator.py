@@ -6,22 +6,33 @@ import numpy as np
 from unittest.mock import Mock, patch
 from src.signals.daily_signal_generator import DailySignalGenerator, DailySignalReport
 
+pytestmark = pytest.mark.filterwarnings(
+    "ignore::FutureWarning",
+    "ignore::pandas.errors.PerformanceWarning",
+)
 
-@pytest.fixture
+_STOCK_CODES_3 = ("000001.SZ", "000002.SZ", "600000.SH")
+_STOCK_CODES_10 = tuple(f"00000{i}.SZ" for i in range(10))
+
+
+@pytest.fixture(scope="session")
 def sample_ohlcv():
     """Create sample OHLCV data."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n = 100
-    close = 100 + np.cumsum(np.random.randn(n) * 2)
+    close = 100 + np.cumsum(rng.standard_normal(n) * 2)
     dates = pd.date_range("2024-01-01", periods=n)
-    return pd.DataFrame({
-        "trade_date": dates.strftime("%Y%m%d"),
-        "open": close - np.random.rand(n),
-        "high": close + np.random.rand(n) * 2,
-        "low": close - np.random.rand(n) * 2,
-        "close": close,
-        "volume": np.random.randint(1000, 10000, n).astype(float)
-    })
+    arr = np.empty(n, dtype=[
+        ("trade_date", "U8"), ("open", "f8"), ("high", "f8"),
+        ("low", "f8"), ("close", "f8"), ("volume", "f8"),
+    ])
+    arr["trade_date"] = dates.strftime("%Y%m%d")
+    arr["open"] = close - rng.random(n)
+    arr["high"] = close + rng.random(n) * 2
+    arr["low"] = close - rng.random(n) * 2
+    arr["close"] = close
+    arr["volume"] = rng.integers(1000, 10000, n, dtype=np.int64)
+    return pd.DataFrame(arr, copy=False)
 
 
 @pytest.fixture
@@ -91,7 +102,7 @@ class TestDailySignalGenerator:
         mock_storage.load_daily.return_value = sample_ohlcv
 
         generator = DailySignalGenerator(storage=mock_storage)
-        stock_codes = ["000001.SZ", "000002.SZ", "600000.SH"]
+        stock_codes = _STOCK_CODES_3
 
         signals = generator.generate_signals(
             stock_codes=stock_codes,
@@ -106,7 +117,7 @@ class TestDailySignalGenerator:
         mock_storage.load_daily.return_value = sample_ohlcv
 
         generator = DailySignalGenerator(storage=mock_storage)
-        stock_codes = ["000001.SZ", "000002.SZ", "600000.SH"]
+        stock_codes = _STOCK_CODES_3
 
         report = generator.generate_report(
             stock_codes=stock_codes,
@@ -122,7 +133,7 @@ class TestDailySignalGenerator:
         mock_storage.load_daily.return_value = sample_ohlcv
 
         generator = DailySignalGenerator(storage=mock_storage)
-        stock_codes = ["000001.SZ", "000002.SZ", "600000.SH"]
+        stock_codes = _STOCK_CODES_3
 
         signals = generator.generate_signals(
             stock_codes=stock_codes,
@@ -131,14 +142,15 @@ class TestDailySignalGenerator:
 
         # Should be sorted by final_score descending
         scores = [s.final_score for s in signals]
-        assert scores == sorted(scores, reverse=True)
+        if len(scores) > 1:
+            assert all(scores[i] >= scores[i + 1] for i in range(len(scores) - 1))
 
     def test_top_signals_in_report(self, sample_ohlcv, mock_storage):
         """Test report includes top buy and sell signals."""
         mock_storage.load_daily.return_value = sample_ohlcv
 
         generator = DailySignalGenerator(storage=mock_storage)
-        stock_codes = [f"00000{i}.SZ" for i in range(10)]
+        stock_codes = _STOCK_CODES_10
 
         report = generator.generate_report(
             stock_codes=stock_codes,
@@ -222,4 +234,4 @@ class TestDailySignalGenerator:
         )
 
         # Verify storage was called with date range
-        mock_storage.load_daily.assert_called()
+        assert mock_storage.load_daily.called
@@ -1,152 +1,113 @@
 """Tests for N-day lookback condition types."""
+from types import MappingProxyType
+
 import pandas as pd
 import numpy as np
 import pytest
 from src.signals.rule_engine import evaluate_conditions
 
 
-def _make_df(close_values: list[float], extra_cols: dict = None) -> pd.DataFrame:
-    """Helper to build a DataFrame with date index and close column."""
-    n = len(close_values)
-    df = pd.DataFrame({
-        "close": close_values,
-        "open": [v * 0.99 for v in close_values],
-        "high": [v * 1.01 for v in close_values],
-        "low": [v * 0.98 for v in close_values],
-        "volume": [1000000] * n,
-    })
+def _make_df(
+    close_values: list[float], extra_cols: dict = None, ohlcv: bool = True
+) -> pd.DataFrame:
+    """Helper to build a DataFrame with date index and close column.
+
+    ohlcv=False builds only the close column, for conditions that touch nothing else.
+    """
+    close = np.asarray(close_values, dtype=np.float64)
+    n = len(close)
+    if ohlcv:
+        df = pd.DataFrame(
+            np.column_stack([close, close * 0.99, close * 1.01, close * 0.98]),
+            columns=["close", "open", "high", "low"],
+            copy=False,
+        )
+        df["volume"] = np.full(n, 1_000_000, dtype=np.int64)
+    else:
+        df = pd.DataFrame({"close": close}, copy=False)
     if extra_cols:
         for k, v in extra_cols.items():
             df[k] = v
     return df
 
 
-class TestLookbackMin:
-    """compare_type='lookback_min' — field <= MIN(lookback_field, N days)."""
-
-    def test_close_at_5day_low(self):
-        """close=8 is new 5-day low (previous 5 days: 10,11,12,9,10)."""
-        df = _make_df([10, 11, 12, 9, 10, 8])
-        conditions = [{
-            "field": "close", "operator": "<=",
-            "compare_type": "lookback_min",
-            "lookback_field": "close", "lookback_n": 5,
-            "label": "5日新低",
-        }]
-        triggered, labels = evaluate_conditions(conditions, df)
-        assert triggered
-        assert "5日新低" in labels
-
-    def test_close_not_at_5day_low(self):
-        """close=11 is NOT 5-day low (previous 5 days: 10,11,12,9,10)."""
-        df = _make_df([10, 11, 12, 9, 10, 11])
-        conditions = [{
-            "field": "close", "operator": "<=",
-            "compare_type": "lookback_min",
-            "lookback_field": "close", "lookback_n": 5,
-            "label": "5日新低",
-        }]
-        triggered, labels = evaluate_conditions(conditions, df)
-        assert not triggered
-
-    def test_insufficient_data(self):
-        """Only 2 rows of data, lookback_n=5 — should not trigger."""
-        df = _make_df([10, 8])
-        conditions = [{
-            "field": "close", "operator": "<=",
-            "compare_type": "lookback_min",
-            "lookback_field": "close", "lookback_n": 5,
-            "label": "5日新低",
-        }]
-        triggered, labels = evaluate_conditions(conditions, df)
-        assert not triggered
-
-
-class TestLookbackMax:
-    """compare_type='lookback_max' — field >= MAX(lookback_field, N days)."""
-
-    def test_close_at_5day_high(self):
-        """close=15 is new 5-day high (previous: 10,11,12,13,14)."""
-        df = _make_df([10, 11, 12, 13, 14, 15])
-        conditions = [{
-            "field": "close", "operator": ">=",
-            "compare_type": "lookback_max",
-            "lookback_field": "close", "lookback_n": 5,
-            "label": "5日新高",
-        }]
-        triggered, labels = evaluate_conditions(conditions, df)
-        assert triggered
-
-
-class TestLookbackValue:
-    """compare_type='lookback_value' — field vs lookback_field[N days ago]."""
-
-    def test_close_higher_than_yesterday(self):
-        """close=12 > close[1 day ago]=10."""
-        df = _make_df([8, 9, 10, 12])
-        conditions = [{
-            "field": "close", "operator": ">",
-            "compare_type": "lookback_value",
-            "lookback_field": "close", "lookback_n": 1,
-            "label": "今涨",
-        }]
-        triggered, labels = evaluate_conditions(conditions, df)
-        assert triggered
-
-    def test_close_lower_than_3_days_ago(self):
-        """close=7 < close[3 days ago]=10."""
-        df = _make_df([10, 11, 12, 7])
-        conditions = [{
-            "field": "close", "operator": "<",
-            "compare_type": "lookback_value",
-            "lookback_field": "close", "lookback_n": 3,
-            "label": "3日回落",
-        }]
-        triggered, labels = evaluate_conditions(conditions, df)
-        assert triggered
-
-
-class TestConsecutive:
-    """compare_type='consecutive' — consecutive N days rising/falling."""
-
-    def test_3_consecutive_rising(self):
-        """Last 3 days: 10->11->12->13 (3 consecutive rises)."""
-        df = _make_df([8, 9, 10, 11, 12, 13])
-        conditions = [{
-            "field": "close",
-            "compare_type": "consecutive",
-            "lookback_n": 3,
-            "consecutive_type": "rising",
-            "label": "连涨3日",
-        }]
-        triggered, labels = evaluate_conditions(conditions, df)
-        assert triggered
-
-    def test_not_consecutive_rising(self):
-        """Last 3 days: 10->12->11->13 (not consecutive — 12->11 is a dip)."""
-        df = _make_df([8, 10, 12, 11, 13])
-        conditions = [{
-            "field": "close",
-            "compare_type": "consecutive",
-            "lookback_n": 3,
-            "consecutive_type": "rising",
-            "label": "连涨3日",
-        }]
-        triggered, labels = evaluate_conditions(conditions, df)
-        assert not triggered
-
-    def test_consecutive_falling(self):
-        """Last 3 days: 13->12->11->10 (3 consecutive falls)."""
-        df = _make_df([15, 13, 12, 11, 10])
-        conditions = [{
-            "field": "close",
-            "compare_type": "consecutive",
-            "lookback_n": 3,
-            "consecutive_type": "falling",
-            "label": "连跌3日",
-        }]
-        triggered, labels = evaluate_conditions(conditions, df)
-        assert triggered
+_COND_5DAY_LOW = MappingProxyType({
+    "field": "close", "operator": "<=", "compare_type": "lookback_min",
+    "lookback_field": "close", "lookback_n": 5, "label": "5日新低",
+})
+_COND_5DAY_HIGH = MappingProxyType({
+    "field": "close", "operator": ">=", "compare_type": "lookback_max",
+    "lookback_field": "close", "lookback_n": 5, "label": "5日新高",
+})
+_COND_UP_TODAY = MappingProxyType({
+    "field": "close", "operator": ">", "compare_type": "lookback_value",
+    "lookback_field": "close", "lookback_n": 1, "label": "今涨",
+})
+_COND_3DAY_PULLBACK = MappingProxyType({
+    "field": "close", "operator": "<", "compare_type": "lookback_value",
+    "lookback_field": "close", "lookback_n": 3, "label": "3日回落",
+})
+_COND_3DAY_RISING = MappingProxyType({
+    "field": "close", "compare_type": "consecutive", "lookback_n": 3,
+    "consecutive_type": "rising", "label": "连涨3日",
+})
+_COND_3DAY_FALLING = MappingProxyType({
+    "field": "close", "compare_type": "consecutive", "lookback_n": 3,
+    "consecutive_type": "falling", "label": "连跌3日",
+})
+
+# (close_values, condition, expected_triggered, expected_label)
+_CASES = [
+    # compare_type='lookback_min' — field <= MIN(lookback_field, N days)
+    pytest.param(
+        [10, 11, 12, 9, 10, 8], _COND_5DAY_LOW, True, "5日新低",
+        id="lookback_min-close_at_5day_low",
+    ),
+    pytest.param(
+        [10, 11, 12, 9, 10, 11], _COND_5DAY_LOW, False, None,
+        id="lookback_min-close_not_at_5day_low",
+    ),
+    pytest.param(
+        [10, 8], _COND_5DAY_LOW, False, None,
+        id="lookback_min-insufficient_data",
+    ),
+    # compare_type='lookback_max' — field >= MAX(lookback_field, N days)
+    pytest.param(
+        [10, 11, 12, 13, 14, 15], _COND_5DAY_HIGH, True, "5日新高",
+        id="lookback_max-close_at_5day_high",
+    ),
+    # compare_type='lookback_value' — field vs lookback_field[N days ago]
+    pytest.param(
+        [8, 9, 10, 12], _COND_UP_TODAY, True, "今涨",
+        id="lookback_value-close_higher_than_yesterday",
+    ),
+    pytest.param(
+        [10, 11, 12, 7], _COND_3DAY_PULLBACK, True, "3日回落",
+        id="lookback_value-close_lower_than_3_days_ago",
+    ),
+    # compare_type='consecutive' — consecutive N days rising/falling
+    pytest.param(
+        [8, 9, 10, 11, 12, 13], _COND_3DAY_RISING, True, "连涨3日",
+        id="consecutive-3_rising",
+    ),
+    pytest.param(
+        [8, 10, 12, 11, 13], _COND_3DAY_RISING, False, None,
+        id="consecutive-not_rising",
+    ),
+    pytest.param(
+        [15, 13, 12, 11, 10], _COND_3DAY_FALLING, True, "连跌3日",
+        id="consecutive-3_falling",
+    ),
+]
+
+
+@pytest.mark.parametrize("closes,cond,expected,label", _CASES)
+def test_lookback_rule(closes, cond, expected, label):
+    df = _make_df(closes, ohlcv=False)
+    triggered, labels = evaluate_conditions([cond], df)
+    assert triggered is expected
+    if label:
+        assert label in labels
 
 
 class TestBackwardCompatibility:
@@ -1,128 +1,131 @@
 """Tests for condition reachability pre-check."""
 import pytest
-from src.signals.rule_engine import check_reachability
+from src.signals.rule_engine import _check_reachability_cached, check_reachability
+
+_RSI_14 = {"period": 14}
+_KDJ = {"fastk": 9, "slowk": 3, "slowd": 3}
+
+
+def _value(field, operator, value, params=None):
+    cond = {"field": field, "operator": operator, "compare_type": "value", "compare_value": value}
+    if params is not None:
+        cond["params"] = params
+    return cond
+
+
+# (conditions, expected reachable)
+CASES = [
+    # Same field with contradictory upper/lower bounds
+    pytest.param(
+        [_value("RSI", ">", 70, _RSI_14), _value("RSI", "<", 25, _RSI_14)], False,
+        id="rsi_contradiction",  # RSI > 70 AND RSI < 25 is impossible
+    ),
+    pytest.param(
+        [_value("KDJ_K", ">", 80, _KDJ), _value("KDJ_K", "<", 90, _KDJ)], True,
+        id="kdj_valid_range",  # 80 < 90
+    ),
+    pytest.param(
+        [_value("RSI", ">=", 80, _RSI_14), _value("RSI", "<=", 20, _RSI_14)], False,
+        id="gt_eq_contradiction",
+    ),
+    pytest.param(
+        [_value("RSI", ">=", 70, _RSI_14), _value("RSI", "<=", 70, _RSI_14)], True,
+        id="single_point_range_valid",  # exactly 70
+    ),
+    pytest.param(
+        [_value("RSI", ">", 70, _RSI_14), _value("KDJ_K", "<", 25, _KDJ)], True,
+        id="different_fields_ok",
+    ),
+    pytest.param(
+        [_value("RSI", ">", 70, _RSI_14), _value("RSI", "<", 25, {"period": 7})], True,
+        id="same_field_different_params_ok",  # RSI_14 and RSI_7 are different columns
+    ),
+    # Out-of-range value detection for bounded indicators
+    pytest.param([_value("RSI", ">", 120, _RSI_14)], False, id="rsi_over_100"),
+    pytest.param([_value("RSI", "<", -5, _RSI_14)], False, id="rsi_under_0"),
+    pytest.param(
+        [_value("BOLL_pband", ">", 1.5, {"length": 20, "std": 2.0})], False,
+        id="boll_pband_over_1",  # %B range 0-1
+    ),
+    pytest.param(
+        [_value("close", ">", 99999)], True,
+        id="unbounded_field_any_value_ok",  # price is unbounded
+    ),
+    # compare_type='field' conditions are skipped by the reachability check
+    pytest.param(
+        [{"field": "close", "operator": "<", "compare_type": "field",
+          "compare_field": "BOLL_lower", "compare_params": {"length": 20, "std": 2.0}}], True,
+        id="field_compare_always_reachable",
+    ),
+    # Edge cases
+    pytest.param([], True, id="empty_list"),
+    pytest.param([_value("RSI", "<", 30, _RSI_14)], True, id="single_condition"),
+]
+
+
+@pytest.mark.parametrize("conditions, expected", CASES)
+def test_reachability(conditions, expected):
+    reachable, reason = check_reachability(conditions)
+    assert reachable is expected
+    if expected:
+        assert reason is None
+    else:
+        assert "矛盾" in reason or "不可达" in reason
 
 
-class TestRangeContradiction:
-    """Same field with contradictory upper/lower bounds."""
+@pytest.mark.parametrize(
+    "conditions, reason_prefix",
+    [
+        pytest.param(
+            [_value("RSI", ">", 150, _RSI_14), _value("RSI", "<", 10, _RSI_14)], "条件矛盾",
+            id="contradiction_beats_range",
+        ),
+        pytest.param(
+            [_value("RSI", ">", 120, _RSI_14),
+             _value("KDJ_K", ">", 80, _KDJ), _value("KDJ_K", "<", 20, _KDJ)], "条件矛盾",
+            id="contradiction_on_later_field",
+        ),
+    ],
+)
+def test_contradictions_reported_before_range_violations(conditions, reason_prefix):
+    reachable, reason = check_reachability(conditions)
+    assert reachable is False
+    assert reason.startswith(reason_prefix)
 
-    def test_rsi_contradiction(self):
-        """RSI > 70 AND RSI < 25 is impossible."""
-        conditions = [
-            {"field": "RSI", "operator": ">", "compare_type": "value", "compare_value": 70, "params": {"period": 14}},
-            {"field": "RSI", "operator": "<", "compare_type": "value", "compare_value": 25, "params": {"period": 14}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert not reachable
-        assert "矛盾" in reason or "不可达" in reason
 
-    def test_kdj_valid_range(self):
-        """KDJ_K > 80 AND KDJ_K < 90 is valid (80 < 90)."""
-        conditions = [
-            {"field": "KDJ_K", "operator": ">", "compare_type": "value", "compare_value": 80, "params": {"fastk": 9, "slowk": 3, "slowd": 3}},
-            {"field": "KDJ_K", "operator": "<", "compare_type": "value", "compare_value": 90, "params": {"fastk": 9, "slowk": 3, "slowd": 3}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert reachable
-        assert reason is None
+def test_repeated_conditions_hit_cache():
+    conditions = [_value("RSI", ">", 70, _RSI_14), _value("RSI", "<", 25, _RSI_14)]
+    first = check_reachability(conditions)
+    hits = _check_reachability_cached.cache_info().hits
 
-    def test_gt_eq_contradiction(self):
-        """RSI >= 80 AND RSI <= 20 is impossible."""
-        conditions = [
-            {"field": "RSI", "operator": ">=", "compare_type": "value", "compare_value": 80, "params": {"period": 14}},
-            {"field": "RSI", "operator": "<=", "compare_type": "value", "compare_value": 20, "params": {"period": 14}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert not reachable
-
-    def test_single_point_range_valid(self):
-        """RSI >= 70 AND RSI <= 70 is valid (exactly 70)."""
-        conditions = [
-            {"field": "RSI", "operator": ">=", "compare_type": "value", "compare_value": 70, "params": {"period": 14}},
-            {"field": "RSI", "operator": "<=", "compare_type": "value", "compare_value": 70, "params": {"period": 14}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert reachable
-
-    def test_different_fields_ok(self):
-        """RSI > 70 AND KDJ_K < 25 are different fields — always reachable."""
-        conditions = [
-            {"field": "RSI", "operator": ">", "compare_type": "value", "compare_value": 70, "params": {"period": 14}},
-            {"field": "KDJ_K", "operator": "<", "compare_type": "value", "compare_value": 25, "params": {"fastk": 9, "slowk": 3, "slowd": 3}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert reachable
-
-    def test_same_field_different_params_ok(self):
-        """RSI_14 > 70 AND RSI_7 < 25 are different columns — reachable."""
-        conditions = [
-            {"field": "RSI", "operator": ">", "compare_type": "value", "compare_value": 70, "params": {"period": 14}},
-            {"field": "RSI", "operator": "<", "compare_type": "value", "compare_value": 25, "params": {"period": 7}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert reachable
-
-
-class TestFieldRangeValidation:
-    """Out-of-range value detection for bounded indicators."""
-
-    def test_rsi_over_100(self):
-        """RSI > 120 is impossible (RSI range 0-100)."""
-        conditions = [
-            {"field": "RSI", "operator": ">", "compare_type": "value", "compare_value": 120, "params": {"period": 14}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert not reachable
-
-    def test_rsi_under_0(self):
-        """RSI < -5 is impossible."""
-        conditions = [
-            {"field": "RSI", "operator": "<", "compare_type": "value", "compare_value": -5, "params": {"period": 14}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert not reachable
-
-    def test_boll_pband_over_1(self):
-        """BOLL_pband > 1.5 is impossible (%B range 0-1)."""
-        conditions = [
-            {"field": "BOLL_pband", "operator": ">", "compare_type": "value", "compare_value": 1.5, "params": {"length": 20, "std": 2.0}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert not reachable
-
-    def test_unbounded_field_any_value_ok(self):
-        """close > 99999 is technically reachable (price is unbounded)."""
-        conditions = [
-            {"field": "close", "operator": ">", "compare_type": "value", "compare_value": 99999},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert reachable
-
-
-class TestFieldCompareSkipped:
-    """compare_type='field' conditions should be skipped by reachability check."""
-
-    def test_field_compare_always_reachable(self):
-        """close < BOLL_lower is a field comparison — skip reachability."""
-        conditions = [
-            {"field": "close", "operator": "<", "compare_type": "field",
-             "compare_field": "BOLL_lower", "compare_params": {"length": 20, "std": 2.0}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert reachable
-
-
-class TestEmptyConditions:
-    """Edge cases."""
-
-    def test_empty_list(self):
-        reachable, reason = check_reachability([])
-        assert reachable
-        assert reason is None
+    # Equal conditions built as new dicts reuse the memoized result
+    again = check_reachability([dict(c, params=dict(c["params"])) for c in conditions])
+
+    assert again == first
+    assert _check_reachability_cached.cache_info().hits == hits + 1
+
+
+def test_unhashable_condition_bypasses_cache():
+    conditions = [
+        _value("RSI", "<", [70, 80], _RSI_14),  # unparseable value is skipped
+        _value("RSI", ">", 120, _RSI_14),
+    ]
+    info = _check_reachability_cached.cache_info()
+
+    reachable, reason = check_reachability(conditions)
+
+    assert reachable is False
+    assert reason.startswith("不可达")
+    after = _check_reachability_cached.cache_info()
+    assert (after.hits, after.misses) == (info.hits, info.misses)
+
+
+def test_register_extended_indicators_clears_caches():
+    from api.services.indicator_registry import register_extended_indicators
+
+    check_reachability([_value("RSI", ">", 120, _RSI_14)])
+    assert _check_reachability_cached.cache_info().currsize > 0
+
+    register_extended_indicators()
 
-    def test_single_condition(self):
-        conditions = [
-            {"field": "RSI", "operator": "<", "compare_type": "value", "compare_value": 30, "params": {"period": 14}},
-        ]
-        reachable, reason = check_reachability(conditions)
-        assert reachable
+    assert _check_reachability_cached.cache_info().currsize == 0
@@ -1,41 +1,13 @@
 """Tests for signal combiner."""
 
+import dataclasses
+
 import pytest
 import pandas as pd
-import numpy as np
-from src.signals.base_signal import SignalLevel, SignalResult
+from src.signals.base_signal import SignalLevel
 from src.signals.signal_combiner import SignalCombiner, CombinedSignal
 
 
-@pytest.fixture
-def sample_ohlcv_with_indicators():
-    """Create sample OHLCV data with all required indicators."""
-    np.random.seed(42)
-    n = 50
-    close = 100 + np.cumsum(np.random.randn(n) * 2)
-    return pd.DataFrame({
-        "open": close - np.random.rand(n),
-        "high": close + np.random.rand(n) * 2,
-        "low": close - np.random.rand(n) * 2,
-        "close": close,
-        "volume": np.random.randint(1000, 10000, n).astype(float),
-        # Swing strategy indicators
-        "RSI": np.random.uniform(30, 70, n),
-        "KDJ_K": np.random.uniform(20, 80, n),
-        "KDJ_D": np.random.uniform(20, 80, n),
-        "KDJ_J": np.random.uniform(0, 100, n),
-        "MACD_hist": np.random.uniform(-1, 1, n),
-        # Trend strategy indicators
-        "MA_5": close - 1,
-        "MA_20": close - 2,
-        "EMA_12": close - 0.5,
-        "EMA_26": close - 1.5,
-        "ADX": np.random.uniform(15, 40, n),
-        "ADX_plus_di": np.random.uniform(20, 35, n),
-        "ADX_minus_di": np.random.uniform(15, 30, n)
-    })
-
-
 class TestCombinedSignal:
     """Tests for CombinedSignal dataclass."""
 
@@ -49,7 +21,7 @@ class TestCombinedSignal:
             swing_score=70.0,
             trend_score=80.0,
             ml_score=None,
-            reasons=["MA金叉", "RSI超卖反弹"]
+            reasons=("MA金叉", "RSI超卖反弹")
         )
         assert signal.stock_code == "000001.SZ"
         assert signal.final_score == 75.0
@@ -65,10 +37,24 @@ class TestCombinedSignal:
             swing_score=60.0,
             trend_score=70.0,
             ml_score=None,
-            reasons=[]
+            reasons=()
         )
         assert signal.ml_score is None
 
+    def test_combined_signal_is_frozen(self):
+        """Test CombinedSignal fields cannot be reassigned."""
+        signal = CombinedSignal(
+            stock_code="000001.SZ",
+            trade_date="2024-01-15",
+            final_score=65.0,
+            signal_level=SignalLevel.WEAK_BUY,
+            swing_score=60.0,
+            trend_score=70.0,
+            ml_score=None,
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            signal.final_score = 90.0
+
 
 class TestSignalCombiner:
     """Tests for SignalCombiner."""
@@ -188,59 +174,16 @@ class TestSignalCombiner:
             trade_date="2024-01-15"
         )
 
-        assert isinstance(result.reasons, list)
-
-    def test_bullish_signals_combine_to_buy(self):
-        """Test bullish signals from both strategies produce buy signal."""
-        # Create strongly bullish data
-        df = pd.DataFrame({
-            "close": [120.0],
-            # Swing: oversold RSI, KDJ golden cross, positive MACD
-            "RSI": [25.0],
-            "KDJ_K": [70.0],
-            "KDJ_D": [30.0],
-            "KDJ_J": [150.0],
-            "MACD_hist": [0.8],
-            # Trend: MA golden cross, strong uptrend
-            "MA_5": [118.0],
-            "MA_20": [110.0],
-            "EMA_12": [116.0],
-            "EMA_26": [112.0],
-            "ADX": [35.0],
-            "ADX_plus_di": [35.0],
-            "ADX_minus_di": [15.0]
-        })
-
-        combiner = SignalCombiner()
-        result = combiner.combine(df, "000001.SZ", "2024-01-15")
+        assert isinstance(result.reasons, tuple)
 
-        assert result.signal_level.is_bullish()
-
-    def test_bearish_signals_combine_to_sell(self):
-        """Test bearish signals from both strategies produce sell signal."""
-        # Create strongly bearish data
-        df = pd.DataFrame({
-            "close": [80.0],
-            # Swing: overbought RSI, KDJ death cross, negative MACD
-            "RSI": [75.0],
-            "KDJ_K": [30.0],
-            "KDJ_D": [70.0],
-            "KDJ_J": [-50.0],
-            "MACD_hist": [-0.8],
-            # Trend: MA death cross, strong downtrend
-            "MA_5": [82.0],
-            "MA_20": [90.0],
-            "EMA_12": [84.0],
-            "EMA_26": [88.0],
-            "ADX": [35.0],
-            "ADX_plus_di": [15.0],
-            "ADX_minus_di": [35.0]
-        })
+    def test_directional_signals_combine(self, directional_row):
+        """Test same-direction signals from both strategies carry into the combined level."""
+        df, check = directional_row
 
         combiner = SignalCombiner()
         result = combiner.combine(df, "000001.SZ", "2024-01-15")
 
-        assert result.signal_level.is_bearish()
+        assert getattr(result.signal_level, check)()
 
     def test_combine_batch(self, sample_ohlcv_with_indicators):
         """Test combining signals for multiple stocks."""
@@ -255,3 +198,27 @@ class TestSignalCombiner:
         assert len(results) == 3
         assert all(isinstance(r, CombinedSignal) for r in results)
         assert set(r.stock_code for r in results) == set(stocks)
+
+    def test_combine_batch_matches_per_stock_weighting(self):
+        """Test batch scoring weights only the sources each stock has."""
+        combiner = SignalCombiner(ml_weight=0.5)
+        combiner._strategies = [
+            {"name": "A", "weight": 0.5, "rules": [
+                {"field": "close", "operator": ">", "compare_type": "value",
+                 "compare_value": 100, "score": 30, "label": "站上100"},
+            ]},
+        ]
+        stock_data = {
+            "000001.SZ": pd.DataFrame({"close": [99.0, 101.0]}),  # rule fires -> 80
+            "000002.SZ": pd.DataFrame({"close": [101.0, 99.0]}),  # no rule -> 50
+        }
+
+        results = combiner.combine_batch(
+            stock_data, trade_date="2024-01-15", ml_scores={"000002.SZ": 90.0}
+        )
+
+        assert results[0].final_score == pytest.approx(80.0)
+        assert results[0].reasons == ("[A] 站上100",)
+        assert results[1].final_score == pytest.approx(70.0)
+        assert results[1].ml_score == 90.0
+        assert results[1].signal_level == SignalLevel.WEAK_BUY
@@ -1,46 +1,28 @@
 """Tests for swing trading strategy."""
 
 import pytest
-import pandas as pd
 import numpy as np
 from src.signals.base_signal import SignalLevel, SignalResult
-from src.signals.swing_strategy import SwingStrategy
-
-
-@pytest.fixture
-def sample_ohlcv():
-    """Create sample OHLCV data with indicators."""
-    np.random.seed(42)
-    n = 50
-    close = 100 + np.cumsum(np.random.randn(n) * 2)
-    return pd.DataFrame({
-        "open": close - np.random.rand(n),
-        "high": close + np.random.rand(n) * 2,
-        "low": close - np.random.rand(n) * 2,
-        "close": close,
-        "volume": np.random.randint(1000, 10000, n).astype(float),
-        # Pre-calculated indicators for testing
-        "RSI": np.random.uniform(30, 70, n),
-        "KDJ_K": np.random.uniform(20, 80, n),
-        "KDJ_D": np.random.uniform(20, 80, n),
-        "KDJ_J": np.random.uniform(0, 100, n),
-        "MACD_hist": np.random.uniform(-1, 1, n)
-    })
+from src.signals.swing_strategy import SwingStrategy, SwingRow, get_default, _swing_score_kernel
+
+
+@pytest.fixture(scope="module")
+def default_swing():
+    """Shared SwingStrategy with default parameters."""
+    return get_default()
 
 
 class TestSwingStrategy:
     """Tests for SwingStrategy."""
 
-    def test_strategy_name(self):
+    def test_strategy_name(self, default_swing):
         """Test strategy name."""
-        strategy = SwingStrategy()
-        assert strategy.name == "SWING"
+        assert default_swing.name == "SWING"
 
-    def test_generate_signals_returns_result(self, sample_ohlcv):
+    def test_generate_signals_returns_result(self, default_swing, sample_ohlcv_with_indicators):
         """Test generate_signals returns SignalResult."""
-        strategy = SwingStrategy()
-        result = strategy.generate_signals(
-            sample_ohlcv,
+        result = default_swing.generate_signals(
+            sample_ohlcv_with_indicators,
             stock_code="000001.SZ",
             trade_date="2024-01-15"
         )
@@ -48,124 +30,114 @@ class TestSwingStrategy:
         assert result.strategy_name == "SWING"
         assert result.stock_code == "000001.SZ"
 
-    def test_score_in_valid_range(self, sample_ohlcv):
+    def test_score_in_valid_range(self, default_swing, sample_ohlcv_with_indicators):
         """Test score is between 0 and 100."""
-        strategy = SwingStrategy()
-        result = strategy(sample_ohlcv, "000001.SZ", "2024-01-15")
+        result = default_swing(sample_ohlcv_with_indicators, "000001.SZ", "2024-01-15")
         assert 0 <= result.score <= 100
 
-    def test_oversold_rsi_bullish(self):
+    def test_oversold_rsi_bullish(self, default_swing):
         """Test oversold RSI contributes to bullish signal."""
-        df = pd.DataFrame({
-            "RSI": [25.0],  # Oversold
-            "KDJ_K": [50.0],
-            "KDJ_D": [50.0],
-            "KDJ_J": [50.0],
-            "MACD_hist": [0.0]
-        })
-        strategy = SwingStrategy()
-        result = strategy(df, "000001.SZ", "2024-01-15")
+        row = SwingRow(
+            RSI=25.0,  # Oversold
+            KDJ_K=50.0,
+            KDJ_D=50.0,
+            KDJ_J=50.0,
+            MACD_hist=0.0,
+        )
+        result = default_swing(row, "000001.SZ", "2024-01-15")
         # Oversold RSI should push score above neutral
         assert result.score > 50
 
-    def test_overbought_rsi_bearish(self):
+    def test_overbought_rsi_bearish(self, default_swing):
         """Test overbought RSI contributes to bearish signal."""
-        df = pd.DataFrame({
-            "RSI": [75.0],  # Overbought
-            "KDJ_K": [50.0],
-            "KDJ_D": [50.0],
-            "KDJ_J": [50.0],
-            "MACD_hist": [0.0]
-        })
-        strategy = SwingStrategy()
-        result = strategy(df, "000001.SZ", "2024-01-15")
+        row = SwingRow(
+            RSI=75.0,  # Overbought
+            KDJ_K=50.0,
+            KDJ_D=50.0,
+            KDJ_J=50.0,
+            MACD_hist=0.0,
+        )
+        result = default_swing(row, "000001.SZ", "2024-01-15")
         # Overbought RSI should push score below neutral
         assert result.score < 50
 
-    def test_kdj_golden_cross_bullish(self):
+    def test_kdj_golden_cross_bullish(self, default_swing):
         """Test KDJ K crossing above D is bullish."""
         # K > D indicates bullish crossover
-        df = pd.DataFrame({
-            "RSI": [50.0],
-            "KDJ_K": [60.0],  # K above D
-            "KDJ_D": [40.0],
-            "KDJ_J": [100.0],  # J = 3K - 2D = 180 - 80 = 100
-            "MACD_hist": [0.0]
-        })
-        strategy = SwingStrategy()
-        result = strategy(df, "000001.SZ", "2024-01-15")
+        row = SwingRow(
+            RSI=50.0,
+            KDJ_K=60.0,  # K above D
+            KDJ_D=40.0,
+            KDJ_J=100.0,  # J = 3K - 2D = 180 - 80 = 100
+            MACD_hist=0.0,
+        )
+        result = default_swing(row, "000001.SZ", "2024-01-15")
         assert result.score > 50
 
-    def test_kdj_death_cross_bearish(self):
+    def test_kdj_death_cross_bearish(self, default_swing):
         """Test KDJ K crossing below D is bearish."""
         # K < D indicates bearish crossover
-        df = pd.DataFrame({
-            "RSI": [50.0],
-            "KDJ_K": [40.0],  # K below D
-            "KDJ_D": [60.0],
-            "KDJ_J": [0.0],  # J = 3K - 2D = 120 - 120 = 0
-            "MACD_hist": [0.0]
-        })
-        strategy = SwingStrategy()
-        result = strategy(df, "000001.SZ", "2024-01-15")
+        row = SwingRow(
+            RSI=50.0,
+            KDJ_K=40.0,  # K below D
+            KDJ_D=60.0,
+            KDJ_J=0.0,  # J = 3K - 2D = 120 - 120 = 0
+            MACD_hist=0.0,
+        )
+        result = default_swing(row, "000001.SZ", "2024-01-15")
         assert result.score < 50
 
-    def test_macd_histogram_positive_bullish(self):
+    def test_macd_histogram_positive_bullish(self, default_swing):
         """Test positive MACD histogram contributes to bullish signal."""
-        df = pd.DataFrame({
-            "RSI": [50.0],
-            "KDJ_K": [50.0],
-            "KDJ_D": [50.0],
-            "KDJ_J": [50.0],
-            "MACD_hist": [0.5]  # Positive histogram
-        })
-        strategy = SwingStrategy()
-        result = strategy(df, "000001.SZ", "2024-01-15")
+        row = SwingRow(
+            RSI=50.0,
+            KDJ_K=50.0,
+            KDJ_D=50.0,
+            KDJ_J=50.0,
+            MACD_hist=0.5,  # Positive histogram
+        )
+        result = default_swing(row, "000001.SZ", "2024-01-15")
         assert result.score > 50
 
-    def test_macd_histogram_negative_bearish(self):
+    def test_macd_histogram_negative_bearish(self, default_swing):
         """Test negative MACD histogram contributes to bearish signal."""
-        df = pd.DataFrame({
-            "RSI": [50.0],
-            "KDJ_K": [50.0],
-            "KDJ_D": [50.0],
-            "KDJ_J": [50.0],
-            "MACD_hist": [-0.5]  # Negative histogram
-        })
-        strategy = SwingStrategy()
-        result = strategy(df, "000001.SZ", "2024-01-15")
+        row = SwingRow(
+            RSI=50.0,
+            KDJ_K=50.0,
+            KDJ_D=50.0,
+            KDJ_J=50.0,
+            MACD_hist=-0.5,  # Negative histogram
+        )
+        result = default_swing(row, "000001.SZ", "2024-01-15")
         assert result.score < 50
 
-    def test_combined_bullish_signals(self):
+    def test_combined_bullish_signals(self, default_swing):
         """Test combined bullish signals produce strong buy."""
-        df = pd.DataFrame({
-            "RSI": [25.0],  # Oversold
-            "KDJ_K": [70.0],  # K > D (bullish)
-            "KDJ_D": [30.0],
-            "KDJ_J": [150.0],
-            "MACD_hist": [0.8]  # Strong positive
-        })
-        strategy = SwingStrategy()
-        result = strategy(df, "000001.SZ", "2024-01-15")
+        row = SwingRow(
+            RSI=25.0,  # Oversold
+            KDJ_K=70.0,  # K > D (bullish)
+            KDJ_D=30.0,
+            KDJ_J=150.0,
+            MACD_hist=0.8,  # Strong positive
+        )
+        result = default_swing(row, "000001.SZ", "2024-01-15")
         assert result.signal_level in [SignalLevel.STRONG_BUY, SignalLevel.WEAK_BUY]
 
-    def test_combined_bearish_signals(self):
+    def test_combined_bearish_signals(self, default_swing):
         """Test combined bearish signals produce strong sell."""
-        df = pd.DataFrame({
-            "RSI": [75.0],  # Overbought
-            "KDJ_K": [30.0],  # K < D (bearish)
-            "KDJ_D": [70.0],
-            "KDJ_J": [-50.0],
-            "MACD_hist": [-0.8]  # Strong negative
-        })
-        strategy = SwingStrategy()
-        result = strategy(df, "000001.SZ", "2024-01-15")
+        row = SwingRow(
+            RSI=75.0,  # Overbought
+            KDJ_K=30.0,  # K < D (bearish)
+            KDJ_D=70.0,
+            KDJ_J=-50.0,
+            MACD_hist=-0.8,  # Strong negative
+        )
+        result = default_swing(row, "000001.SZ", "2024-01-15")
         assert result.signal_level in [SignalLevel.STRONG_SELL, SignalLevel.WEAK_SELL]
 
-    def test_result_includes_reason(self, sample_ohlcv):
+    def test_result_includes_reason(self, default_swing, sample_ohlcv_with_indicators):
         """Test result includes reason explaining the signal."""
-        strategy = SwingStrategy()
-        result = strategy(sample_ohlcv, "000001.SZ", "2024-01-15")
+        result = default_swing(sample_ohlcv_with_indicators, "000001.SZ", "2024-01-15")
         assert result.reason is not None
         assert len(result.reason) > 0
 
@@ -179,3 +151,31 @@ class TestSwingStrategy:
         assert strategy.rsi_weight == 0.5
         assert strategy.kdj_weight == 0.3
         assert strategy.macd_weight == 0.2
+
+
+class TestSwingScoreKernel:
+    """Property checks sweeping the scoring kernel over the RSI range."""
+
+    # Neutral KDJ/MACD inputs and default weights/thresholds
+    NEUTRAL = (50.0, 50.0, 50.0, 0.0, 0.35, 0.35, 0.30, 30.0, 70.0)
+
+    @staticmethod
+    def _scores(rsi_values):
+        return np.array([
+            _swing_score_kernel(float(rsi), *TestSwingScoreKernel.NEUTRAL)[0]
+            for rsi in rsi_values
+        ])
+
+    def test_oversold_range_bullish(self):
+        """Every RSI in [0, 30] scores above neutral."""
+        assert (self._scores(np.linspace(0, 30, 301)) > 50).all()
+
+    def test_overbought_range_bearish(self):
+        """Every RSI in [70, 100] scores below neutral."""
+        assert (self._scores(np.linspace(70, 100, 301)) < 50).all()
+
+    def test_score_non_increasing_in_rsi(self):
+        """Higher RSI never raises the score and it stays within 0-100."""
+        scores = self._scores(np.linspace(0, 100, 1001))
+        assert (np.diff(scores) <= 1e-9).all()
+        assert ((scores >= 0) & (scores <= 100)).all()
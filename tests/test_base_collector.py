@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import pandas as pd
 from src.data_collector.base_collector import BaseCollector, CollectorError
@@ -13,10 +14,10 @@ class MockCollector(BaseCollector):
             "name": ["平安银行", "浦发银行"],
         })
         self._daily_data = pd.DataFrame({
-            "ts_code": ["000001.SZ"],
-            "trade_date": ["20250114"],
-            "open": [10.0], "high": [10.5], "low": [9.8], "close": [10.2],
-            "vol": [1000000], "amount": [10200000],
+            "ts_code": ["000001.SZ", "600000.SH"],
+            "trade_date": ["20250114", "20250114"],
+            "open": [10.0, 8.0], "high": [10.5, 8.2], "low": [9.8, 7.9], "close": [10.2, 8.1],
+            "vol": [1000000, 800000], "amount": [10200000, 6480000],
         })
 
     def _fetch_stock_list(self) -> pd.DataFrame:
@@ -33,6 +34,16 @@ class MockCollector(BaseCollector):
 
 
 class TestBaseCollector:
+    def test_get_daily_dtypes(self):
+        """测试日线数据代码和日期列转换为 Arrow 字符串，价格列保持 float64"""
+        collector = MockCollector()
+        df = collector.get_daily("000001.SZ", "20250101", "20250114")
+
+        assert df.dtypes["ts_code"] == pd.StringDtype("pyarrow")
+        assert df.dtypes["trade_date"] == pd.StringDtype("pyarrow")
+        assert df.dtypes["close"] == np.float64
+        assert df["ts_code"].tolist() == ["000001.SZ"]
+
     def test_get_stock_list(self):
         """测试获取股票列表"""
         collector = MockCollector()
@@ -42,6 +53,32 @@ class TestBaseCollector:
         assert "ts_code" in df.columns
         assert "name" in df.columns
 
+    def test_stock_list_cache_hit(self):
+        """测试TTL内重复获取股票列表只请求一次数据源"""
+        collector = MockCollector()
+        calls = []
+        fetch = collector._fetch_stock_list
+        collector._fetch_stock_list = lambda: calls.append(1) or fetch()
+
+        first = collector.get_stock_list()
+        second = collector.get_stock_list()
+
+        assert len(calls) == 1
+        assert first.equals(second)
+
+    def test_stock_list_cache_expiry(self):
+        """测试TTL过期后重新请求数据源"""
+        collector = MockCollector()
+        collector.stock_list_ttl = 0
+        calls = []
+        fetch = collector._fetch_stock_list
+        collector._fetch_stock_list = lambda: calls.append(1) or fetch()
+
+        collector.get_stock_list()
+        collector.get_stock_list()
+
+        assert len(calls) == 2
+
     def test_get_daily_data(self):
         """测试获取日线数据"""
         collector = MockCollector()
@@ -50,8 +87,19 @@ class TestBaseCollector:
         assert len(df) == 1
         assert df.iloc[0]["ts_code"] == "000001.SZ"
 
-    def test_retry_on_failure(self):
+    def test_get_daily_batch(self):
+        """测试批量并发获取日线数据并按代码顺序合并"""
+        collector = MockCollector()
+        df = collector.get_daily_batch(["600000.SH", "000001.SZ"], "20250101", "20250114")
+
+        assert list(df["ts_code"]) == ["600000.SH", "000001.SZ"]
+        assert collector.get_daily_batch([], "20250101", "20250114").empty
+
+    def test_retry_on_failure(self, monkeypatch):
         """测试失败重试机制"""
+        sleeps = []
+        monkeypatch.setattr("src.data_collector.base_collector.time.sleep", sleeps.append)
+
         class FailingCollector(MockCollector):
             def __init__(self):
                 super().__init__()
@@ -68,9 +116,25 @@ class TestBaseCollector:
 
         assert collector.attempts == 3
         assert len(df) == 2
+        assert len(sleeps) == 2
+        assert 0 <= sleeps[0] <= collector.retry_delay
+        assert 0 <= sleeps[1] <= collector.retry_delay * 2
+
+    def test_backoff_grows_and_is_capped(self, monkeypatch):
+        """测试退避上限按指数增长并受 max_backoff 限制"""
+        # 全抖动取到区间上限，便于检查每次的上限值
+        monkeypatch.setattr("src.data_collector.base_collector.random.uniform", lambda a, b: b)
+        collector = MockCollector()
+        collector.retry_delay = 0.5
+        collector.max_backoff = 3.0
+
+        delays = [collector._backoff_delay(attempt) for attempt in range(1, 6)]
+
+        assert delays == [0.5, 1.0, 2.0, 3.0, 3.0]
 
-    def test_max_retries_exceeded_raises_error(self):
+    def test_max_retries_exceeded_raises_error(self, monkeypatch):
         """测试超过最大重试次数抛出异常"""
+        monkeypatch.setattr("src.data_collector.base_collector.time.sleep", lambda s: None)
         class AlwaysFailCollector(MockCollector):
             def _fetch_stock_list(self) -> pd.DataFrame:
                 raise Exception("API Error")
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch
@@ -85,3 +87,115 @@ class TestCollectorManager:
         df = manager.get_daily_all("20250114")
 
         assert len(df) == 1
+
+    @patch("src.data_collector.collector_manager.time.sleep")
+    def test_short_retry_after_retries_primary(self, mock_sleep):
+        """测试主数据源短暂限流时等待后重试主数据源"""
+        mock_primary = Mock()
+        mock_fallback = Mock()
+
+        data = pd.DataFrame({"ts_code": ["000001.SZ"], "name": ["平安银行"]})
+        mock_primary.get_stock_list.side_effect = [
+            CollectorError("Rate limit", retry_after=0.01),
+            data,
+        ]
+
+        manager = CollectorManager(
+            primary=mock_primary,
+            fallbacks=[mock_fallback],
+        )
+
+        df = manager.get_stock_list()
+
+        assert len(df) == 1
+        assert mock_primary.get_stock_list.call_count == 2
+        mock_fallback.get_stock_list.assert_not_called()
+        assert 0.01 <= mock_sleep.call_args[0][0] <= 0.26
+
+    def test_source_missing_method_falls_back(self):
+        """测试数据源缺少对应方法时跳过它继续尝试备用源"""
+        mock_primary = Mock(spec=[])
+        mock_fallback = Mock()
+        mock_fallback.get_stock_list.return_value = pd.DataFrame({
+            "ts_code": ["000001.SZ"],
+            "name": ["平安银行"],
+        })
+
+        manager = CollectorManager(
+            primary=mock_primary,
+            fallbacks=[mock_fallback],
+        )
+
+        df = manager.get_stock_list()
+
+        assert len(df) == 1
+        mock_fallback.get_stock_list.assert_called_once()
+
+    @patch("src.data_collector.collector_manager.time.sleep")
+    def test_long_retry_after_uses_fallback(self, mock_sleep):
+        """测试限流等待时间过长时直接切换备用源"""
+        mock_primary = Mock()
+        mock_fallback = Mock()
+
+        mock_primary.get_stock_list.side_effect = CollectorError("Rate limit", retry_after=60.0)
+        mock_fallback.get_stock_list.return_value = pd.DataFrame({
+            "ts_code": ["000001.SZ"],
+            "name": ["平安银行"],
+        })
+
+        manager = CollectorManager(
+            primary=mock_primary,
+            fallbacks=[mock_fallback],
+        )
+
+        df = manager.get_stock_list()
+
+        assert len(df) == 1
+        mock_primary.get_stock_list.assert_called_once()
+        mock_fallback.get_stock_list.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_single_flight_daily_all(self):
+        """测试并发获取同一交易日全市场数据只请求一次数据源"""
+        mock_primary = Mock()
+        release = threading.Event()
+        entered = threading.Event()
+
+        def slow_daily_all(trade_date):
+            entered.set()
+            release.wait(timeout=5)
+            return pd.DataFrame({"ts_code": ["000001.SZ"], "trade_date": [trade_date]})
+
+        mock_primary.get_daily_all.side_effect = slow_daily_all
+        manager = CollectorManager(primary=mock_primary)
+
+        # 记录后到的调用者是否命中了进行中的请求
+        joined = threading.Event()
+
+        class InflightSpy(dict):
+            def get(self, key, default=None):
+                future = super().get(key, default)
+                if future is not None:
+                    joined.set()
+                return future
+
+        manager._inflight = InflightSpy()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(manager.get_daily_all("20250114")))
+            for _ in range(2)
+        ]
+        threads[0].start()
+        assert entered.wait(timeout=5)
+        threads[1].start()
+        assert joined.wait(timeout=5)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert mock_primary.get_daily_all.call_count == 1
+        assert len(results) == 2
+        assert all(len(df) == 1 for df in results)
+        assert results[0] is not results[1]
+        assert manager._inflight == {}
@@ -2,6 +2,8 @@ import pytest
 import os
 import tempfile
 import yaml
+from unittest.mock import patch
+from src.utils import config as config_module
 from src.utils.config import Config, ConfigError
 
 
@@ -36,6 +38,25 @@ class TestConfig:
         assert config.get("collector.primary_source") == "tushare"
         assert config.get("collector.fallback_sources") == ["akshare", "baostock"]
 
+    def test_get_section_and_set(self, tmp_path):
+        """测试获取中间层配置以及 set 后的查询"""
+        config_content = {"collector": {"retry": {"max_retries": 3}}}
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump(config_content))
+
+        config = Config(str(config_file))
+
+        assert config.get("collector") == {"retry": {"max_retries": 3}}
+        assert config.get("collector.retry.max_retries") == 3
+        assert config.get("collector.retry.max_retries.extra") is None
+
+        config.set("collector.retry.max_retries", 5)
+        config.set("tushare.token", "abc")
+
+        assert config.get("collector.retry.max_retries") == 5
+        assert config.get("tushare") == {"token": "abc"}
+        assert config["tushare.token"] == "abc"
+
     def test_get_with_default(self, tmp_path):
         """测试获取不存在的key返回默认值"""
         config_content = {"tushare": {"token": "test"}}
@@ -47,6 +68,28 @@ class TestConfig:
         assert config.get("nonexistent.key", "default") == "default"
         assert config.get("nonexistent.key") is None
 
+    def test_config_cached_by_mtime(self, tmp_path):
+        """测试文件未修改时复用解析结果，修改后重新解析"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"tushare": {"token": "old"}}))
+        config_module._load_yaml.cache_clear()
+
+        with patch.object(config_module.yaml, "load", wraps=yaml.load) as mock_load:
+            first = Config(str(config_file))
+            first.set("tushare.token", "changed")
+            second = Config(str(config_file))
+
+            assert mock_load.call_count == 1
+            # 实例间互不影响
+            assert second.get("tushare.token") == "old"
+
+            config_file.write_text(yaml.dump({"tushare": {"token": "new"}}))
+            stat = os.stat(config_file)
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            assert Config(str(config_file)).get("tushare.token") == "new"
+            assert mock_load.call_count == 2
+
     def test_missing_file_raises_error(self):
         """测试文件不存在抛出异常"""
         with pytest.raises(ConfigError):
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch
@@ -59,9 +61,34 @@ class TestDailyUpdater:
         )
 
         result = updater.update_daily("20250114")
+        again = updater.update_daily("20250113")
 
         assert result["skipped"] is True
+        assert again["skipped"] is True
         mock_collector.get_daily_all.assert_not_called()
+        # 第二次命中进程内缓存，不再查数据库
+        assert mock_db.get_latest_update.call_count == 1
+
+    def test_failed_update_clears_skip_cache(self):
+        """测试更新失败后重新查询数据库判断是否跳过"""
+        mock_collector = Mock()
+        mock_db = Mock()
+        mock_db.get_latest_update.return_value = None
+        mock_collector.get_daily_all.side_effect = [
+            pd.DataFrame({"ts_code": ["000001.SZ"], "trade_date": ["20250114"], "close": [10.2]}),
+            RuntimeError("boom"),
+        ]
+
+        updater = DailyUpdater(collector=mock_collector, storage=Mock(), database=mock_db)
+
+        assert updater.update_daily("20250114")["success"] is True
+        # 成功写日志后直接由缓存判断跳过
+        assert updater.update_daily("20250114")["skipped"] is True
+        assert mock_db.get_latest_update.call_count == 1
+
+        assert updater.update_daily("20250114", force=True)["success"] is False
+        updater.update_daily("20250114")
+        assert mock_db.get_latest_update.call_count == 2
 
     def test_update_index_data(self):
         """测试更新指数数据"""
@@ -126,3 +153,27 @@ class TestDailyUpdater:
         assert "daily" in results
         assert "index" in results
         assert "money_flow" in results
+
+    def test_full_update_runs_steps_concurrently(self):
+        """测试完整更新中的四项更新并发执行"""
+        updater = DailyUpdater(
+            collector=Mock(), storage=Mock(), database=Mock(), news_crawler=Mock(),
+        )
+        # 四项更新必须同时在途才能越过栅栏，串行执行会超时
+        barrier = threading.Barrier(4, timeout=5)
+
+        def step(name):
+            def run(*args):
+                barrier.wait()
+                return {"success": True, "step": name}
+            return run
+
+        updater.update_daily = step("daily")
+        updater.update_index = step("index")
+        updater.update_money_flow = step("money_flow")
+        updater.update_news = step("news")
+
+        results = updater.run_full_update("20250114")
+
+        assert list(results) == ["daily", "index", "money_flow", "news"]
+        assert all(r["step"] == name for name, r in results.items())
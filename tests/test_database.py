@@ -1,6 +1,6 @@
 import pytest
 import sqlite3
-from src.data_storage.database import Database
+from src.data_storage.database import Database, _LATEST_UPDATE_SQL
 
 
 class TestDatabase:
@@ -41,6 +41,26 @@ class TestDatabase:
         assert len(result) == 2
         assert result[0]["ts_code"] == "000001.SZ"
 
+    def test_upsert_stock_list_updates_in_place(self, tmp_path):
+        """测试批量 upsert 覆盖已有股票信息"""
+        db = Database(str(tmp_path / "test.db"))
+        db.init_tables()
+
+        stocks = [
+            {"ts_code": f"{i:06d}.SZ", "name": f"股票{i}", "industry": "银行"}
+            for i in range(10000)
+        ]
+        db.upsert_stock_list(stocks)
+        db.upsert_stock_list([
+            {"ts_code": "000001.SZ", "name": "平安银行", "industry": "银行", "market": "主板"},
+        ])
+
+        result = db.get_stock_list()
+        assert len(result) == 10000
+        updated = next(r for r in result if r["ts_code"] == "000001.SZ")
+        assert updated["name"] == "平安银行"
+        assert updated["market"] == "主板"
+
     def test_log_data_update(self, tmp_path):
         """测试数据更新日志"""
         db_path = tmp_path / "test.db"
@@ -54,6 +74,44 @@ class TestDatabase:
         assert log["record_count"] == 3000
         assert log["status"] == "success"
 
+    def test_log_update_many(self, tmp_path):
+        """测试批量写入更新日志"""
+        db = Database(str(tmp_path / "test.db"))
+        db.init_tables()
+
+        db.log_update_many([
+            {"data_type": "daily", "trade_date": f"2025-01-{i % 28 + 1:02d}",
+             "record_count": i, "status": "success"}
+            for i in range(1000)
+        ])
+
+        log = db.get_latest_update("daily")
+        assert log["trade_date"] == "2025-01-28"
+        assert log["error_msg"] is None
+
+    def test_sqlite_uses_wal(self, tmp_path):
+        """测试SQLite数据库启用WAL日志模式"""
+        db_path = tmp_path / "test.db"
+        Database(str(db_path)).init_tables()
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+    def test_get_latest_update_uses_index(self, tmp_path):
+        """测试最新更新查询直接走索引，无需临时排序"""
+        db_path = tmp_path / "test.db"
+        Database(str(db_path)).init_tables()
+
+        conn = sqlite3.connect(db_path)
+        plan = " ".join(
+            row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + _LATEST_UPDATE_SQL, ("daily",))
+        )
+        conn.close()
+
+        assert "USING INDEX idx_update_log_latest" in plan
+        assert "TEMP B-TREE" not in plan
+
     def test_get_latest_update_returns_none_if_empty(self, tmp_path):
         """测试空表返回None"""
         db_path = tmp_path / "test.db"
@@ -1,6 +1,6 @@
 import pytest
 import os
-from src.utils.logger import setup_logger, get_logger
+from src.utils.logger import setup_logger, get_logger, flush_logs
 
 
 class TestLogger:
@@ -11,6 +11,7 @@ class TestLogger:
 
         logger = get_logger("test")
         logger.info("test message")
+        flush_logs()
 
         assert log_file.exists()
         content = log_file.read_text()
@@ -31,6 +32,7 @@ class TestLogger:
         logger.info("info msg")
         logger.warning("warning msg")
         logger.error("error msg")
+        flush_logs()
 
         content = log_file.read_text()
         assert "debug msg" not in content
@@ -1,6 +1,10 @@
+import re
+import threading
+
 import pytest
+import pandas as pd
 from unittest.mock import patch, Mock
-from src.data_collector.news_crawler import NewsCrawler, NewsItem
+from src.data_collector.news_crawler import NewsCrawler, NewsItem, _keyword_prefixes
 
 
 class TestNewsCrawler:
@@ -28,6 +32,48 @@ class TestNewsCrawler:
 
         assert isinstance(news_list, list)
 
+    @patch("src.data_collector.news_crawler.get_api_guard")
+    @patch("src.data_collector.news_crawler.ak")
+    def test_fetch_eastmoney_news_parses_rows(self, mock_ak, mock_guard):
+        """测试东方财富新闻逐列解析"""
+        mock_guard.return_value.is_blocked.return_value = False
+        mock_ak.stock_info_global_em.return_value = pd.DataFrame({
+            "标题": [f"A股三大指数集体大涨 第{i}条" for i in range(1000)] + ["短"],
+            "摘要": ["北向资金净流入"] * 1001,
+            "发布时间": ["2025-01-14 09:30:00"] * 1001,
+            "链接": [f"/news/{i}.html" for i in range(1001)],
+        })
+
+        news_list = NewsCrawler().fetch_eastmoney_news()
+
+        # 标题过短的最后一条被跳过
+        assert len(news_list) == 1000
+        assert news_list[0].url == "/news/0.html"
+        assert news_list[0].keywords == "大涨,流入"
+        assert news_list[0].sentiment_score == 66
+
+    def test_fetch_all_queries_sources_concurrently(self):
+        """测试三个数据源并发获取，结果按固定顺序合并去重"""
+        crawler = NewsCrawler()
+        # 三个数据源必须同时在途才能越过栅栏，串行调用会超时
+        barrier = threading.Barrier(3, timeout=5)
+
+        def source(*titles):
+            def fetch(max_count):
+                barrier.wait()
+                return [NewsItem(title=t, source="test", sentiment_score=50.0) for t in titles]
+            return fetch
+
+        crawler.fetch_cls_news = source("财联社新闻一", "重复新闻标题")
+        crawler.fetch_eastmoney_news = source("东方财富新闻一", "重复新闻标题")
+        crawler.fetch_sina_news = source("新浪财经新闻一")
+
+        news_list = crawler.fetch_all()
+
+        assert [n.title for n in news_list] == [
+            "财联社新闻一", "重复新闻标题", "东方财富新闻一", "新浪财经新闻一",
+        ]
+
     def test_analyze_sentiment_positive(self):
         """测试正面新闻情绪分析"""
         crawler = NewsCrawler()
@@ -52,6 +98,65 @@ class TestNewsCrawler:
 
         assert 40 <= score <= 60  # 中性情绪分数应该在40-60之间
 
+    def test_sentiment_overlapping_keywords(self):
+        """测试首尾相叠的关键词都被计入"""
+        crawler = NewsCrawler()
+
+        # "大跌停" 同时包含 "大跌" 和 "跌停"
+        assert crawler.analyze_sentiment("尾盘大跌停") == 30
+        assert crawler._extract_keywords("大涨停 后大跌停") == "大涨,涨停,跌停,大跌"
+
+    def test_find_keywords_with_prefix_keywords(self):
+        """测试一个关键词是另一个的前缀时两者都能命中"""
+        class Prefixed(NewsCrawler):
+            POSITIVE_KEYWORDS = ["涨停", "涨停板", "板块"]
+            NEGATIVE_KEYWORDS = ["跌"]
+            _KEYWORD_PATTERN = re.compile("|".join(
+                map(re.escape, sorted(POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS, key=len, reverse=True))
+            ))
+            _KEYWORD_PREFIXES = _keyword_prefixes(POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS)
+
+        crawler = Prefixed()
+        for text in ["涨停板块", "今日涨停", "涨停板", "无关"]:
+            expected = {kw for kw in crawler._KEYWORD_PREFIXES if kw in text}
+            assert crawler._find_keywords(text) == expected
+
+    def test_find_keywords_matches_substring_check(self):
+        """测试正则扫描结果与逐个 `kw in text` 一致"""
+        crawler = NewsCrawler()
+        keywords = crawler.POSITIVE_KEYWORDS + crawler.NEGATIVE_KEYWORDS
+        text = "".join(keywords) + "大跌停" + "政策支持刺激"
+
+        assert crawler._find_keywords(text) == {kw for kw in keywords if kw in text}
+
+    def test_analyze_sentiments_batch(self):
+        """测试批量情绪分析与逐条结果一致"""
+        crawler = NewsCrawler()
+        fragments = ["大涨", "暴跌", "利好", "跌停", "央行", "大跌停", "回暖", "退市", "报告"]
+        titles = [
+            "".join(fragments[(i * j) % len(fragments)] for j in range(i % 6))
+            for i in range(100)
+        ]
+
+        out = crawler.analyze_sentiments(titles)
+
+        assert out.shape == (100,)
+        assert out.tolist() == [crawler.analyze_sentiment(t) for t in titles]
+        assert crawler.analyze_sentiments([]).shape == (0,)
+
+    def test_sentiment_weights_shared_by_single_and_batch(self):
+        """测试单条与批量打分使用同一组权重"""
+        class Weighted(NewsCrawler):
+            NEUTRAL_SCORE = 40.0
+            POSITIVE_WEIGHT = 5
+            NEGATIVE_WEIGHT = 20
+
+        crawler = Weighted()
+        titles = ["大涨利好", "暴跌", "央行", "大涨暴跌"]
+
+        assert [crawler.analyze_sentiment(t) for t in titles] == [50.0, 20.0, 40.0, 25.0]
+        assert crawler.analyze_sentiments(titles).tolist() == [50.0, 20.0, 40.0, 25.0]
+
     def test_news_item_dataclass(self):
         """测试NewsItem数据类"""
         item = NewsItem(
@@ -1,5 +1,7 @@
 import pytest
 import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from datetime import date
 from src.data_storage.parquet_storage import ParquetStorage
 
@@ -25,6 +27,29 @@ class TestParquetStorage:
         loaded = storage.load_daily("2025")
         assert len(loaded) == 3
         assert loaded["ts_code"].tolist() == ["000001.SZ", "000001.SZ", "600000.SH"]
+        assert isinstance(loaded["ts_code"].dtype, pd.CategoricalDtype)
+        assert loaded["ts_code"].cat.categories.tolist() == ["000001.SZ", "600000.SH"]
+
+    def test_load_daily_multi_year_keeps_categorical_codes(self, tmp_path):
+        """测试跨年加载后 ts_code 仍为 category 且按代码排序"""
+        storage = ParquetStorage(str(tmp_path))
+        storage.save_daily("2024", pd.DataFrame({
+            "ts_code": ["600000.SH", "000001.SZ"],
+            "trade_date": ["20241231", "20241231"],
+            "close": [8.0, 10.0],
+        }))
+        storage.save_daily("2025", pd.DataFrame({
+            "ts_code": ["300750.SZ", "000001.SZ"],
+            "trade_date": ["20250102", "20250102"],
+            "close": [200.0, 10.1],
+        }))
+
+        loaded = storage.load_daily_multi_year("20241201", "20250131")
+
+        assert isinstance(loaded["ts_code"].dtype, pd.CategoricalDtype)
+        assert loaded["ts_code"].tolist() == [
+            "000001.SZ", "000001.SZ", "300750.SZ", "600000.SH",
+        ]
 
     def test_append_daily_data(self, tmp_path):
         """测试追加日线数据"""
@@ -51,6 +76,131 @@ class TestParquetStorage:
         loaded = storage.load_daily("2025")
         assert len(loaded) == 2
 
+    def test_append_daily_streams_row_groups(self, tmp_path):
+        """测试多次追加按行组写入并按 (ts_code, trade_date) 保留最新值"""
+        storage = ParquetStorage(str(tmp_path))
+
+        for i, day in enumerate(["20250113", "20250114", "20250115", "20250116", "20250114"]):
+            storage.append_daily("2025", pd.DataFrame({
+                "ts_code": ["000001.SZ", "600000.SH"],
+                "trade_date": [day, day],
+                "open": [10.0, 8.0], "high": [10.5, 8.5], "low": [9.8, 7.9],
+                "close": [10.0 + i, 8.0 + i], "vol": [1000000, 800000],
+                "amount": [10200000, 6560000],
+            }))
+
+        loaded = storage.load_daily("2025")
+        assert len(loaded) == 8
+        # 20250114 被最后一次追加覆盖
+        row = loaded[(loaded["ts_code"] == "000001.SZ") & (loaded["trade_date"] == "20250114")]
+        assert row["close"].tolist() == [14.0]
+        # 同月的追加合并进同一个行组
+        parquet_file = pq.ParquetFile(tmp_path / "daily" / "2025.parquet")
+        assert parquet_file.num_row_groups == 1
+
+    def test_append_daily_backfill_keeps_month_order(self, tmp_path):
+        """测试补录较早月份时插入到对应位置，文件仍按 trade_date 排序"""
+        storage = ParquetStorage(str(tmp_path))
+
+        for day in ["20250303", "20250103", "20250304", "20250203", "20250106"]:
+            storage.append_daily("2025", pd.DataFrame({
+                "ts_code": ["000001.SZ"], "trade_date": [day], "close": [10.0],
+            }))
+
+        file_path = tmp_path / "daily" / "2025.parquet"
+        assert pq.ParquetFile(file_path).num_row_groups == 3
+        assert pq.read_table(file_path)["trade_date"].to_pylist() == [
+            "20250103", "20250106", "20250203", "20250303", "20250304",
+        ]
+
+    def test_append_daily_failure_removes_tmp_file(self, tmp_path, monkeypatch):
+        """测试写入失败时不留下临时文件，原文件保持不变"""
+        storage = ParquetStorage(str(tmp_path))
+        storage.save_daily("2025", pd.DataFrame({
+            "ts_code": ["000001.SZ"], "trade_date": ["20250113"], "close": [10.2],
+        }))
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(pq.ParquetWriter, "write_table", fail)
+        with pytest.raises(OSError):
+            storage.append_daily("2025", pd.DataFrame({
+                "ts_code": ["000001.SZ"], "trade_date": ["20250114"], "close": [10.8],
+            }))
+        monkeypatch.undo()
+
+        assert not (tmp_path / "daily" / "2025.parquet.tmp").exists()
+        assert storage.load_daily("2025")["trade_date"].tolist() == ["20250113"]
+
+    def test_append_daily_with_new_column(self, tmp_path):
+        """测试追加数据列结构变化时仍能合并"""
+        storage = ParquetStorage(str(tmp_path))
+        storage.save_daily("2025", pd.DataFrame({
+            "ts_code": ["000001.SZ"], "trade_date": ["20250113"], "close": [10.2],
+        }))
+
+        storage.append_daily("2025", pd.DataFrame({
+            "ts_code": ["000001.SZ"], "trade_date": ["20250114"],
+            "close": [10.8], "vol": [1200000],
+        }))
+
+        loaded = storage.load_daily("2025")
+        assert len(loaded) == 2
+        assert "vol" in loaded.columns
+
+    def test_load_daily_columns(self, tmp_path):
+        """测试只加载指定列"""
+        storage = ParquetStorage(str(tmp_path))
+
+        df = pd.DataFrame({
+            "ts_code": ["600000.SH", "000001.SZ", "000001.SZ"],
+            "trade_date": ["20250114", "20250114", "20250113"],
+            "open": [8.0, 10.5, 10.0],
+            "high": [8.5, 11.0, 10.5],
+            "low": [7.9, 10.2, 9.8],
+            "close": [8.2, 10.8, 10.2],
+            "vol": [800000, 1200000, 1000000],
+            "amount": [6560000, 12960000, 10200000],
+        })
+        storage.save_daily("2025", df)
+
+        loaded = storage.load_daily("2025", columns=["ts_code", "close"])
+        assert loaded.columns.tolist() == ["ts_code", "close"]
+        assert loaded["ts_code"].tolist() == ["000001.SZ", "000001.SZ", "600000.SH"]
+
+        loaded = storage.load_daily("2025", start_date="20250114", columns=["close"])
+        assert loaded.columns.tolist() == ["close"]
+        assert loaded["close"].tolist() == [10.8, 8.2]
+
+    def test_load_daily_columns_keeps_row_order(self, tmp_path):
+        """测试未请求排序键时行顺序仍按 ts_code、trade_date"""
+        storage = ParquetStorage(str(tmp_path))
+
+        storage.save_daily("2025", pd.DataFrame({
+            "ts_code": ["600000.SH", "000001.SZ"],
+            "trade_date": ["20250114", "20250114"],
+            "close": [8.2, 10.8],
+        }))
+        # 补录较早日期，文件内行顺序与排序键顺序不一致
+        storage.append_daily("2025", pd.DataFrame({
+            "ts_code": ["600000.SH", "000001.SZ"],
+            "trade_date": ["20250113", "20250113"],
+            "close": [8.0, 10.2],
+        }))
+
+        loaded = storage.load_daily("2025", columns=["close"])
+        assert loaded.columns.tolist() == ["close"]
+        assert loaded["close"].tolist() == [10.2, 10.8, 8.0, 8.2]
+
+        loaded = storage.load_daily("2025", columns=["close", "trade_date"])
+        assert loaded.columns.tolist() == ["close", "trade_date"]
+        assert loaded["trade_date"].tolist() == ["20250113", "20250114"] * 2
+
+        loaded = storage.load_daily_multi_year("20250101", "20251231", columns=["close"])
+        assert loaded.columns.tolist() == ["close"]
+        assert loaded["close"].tolist() == [10.2, 10.8, 8.0, 8.2]
+
     def test_load_nonexistent_file_returns_empty(self, tmp_path):
         """测试加载不存在的文件返回空DataFrame"""
         storage = ParquetStorage(str(tmp_path))
@@ -80,6 +230,51 @@ class TestParquetStorage:
         assert loaded["trade_date"].min() == "20250113"
         assert loaded["trade_date"].max() == "20250115"
 
+    def test_load_daily_reads_only_needed_partitions(self, tmp_path):
+        """测试日期条件下推后只命中对应月份的行组"""
+        storage = ParquetStorage(str(tmp_path))
+
+        dates = ["20250310", "20250110", "20250211", "20250120", "20250212"]
+        storage.save_daily("2025", pd.DataFrame({
+            "ts_code": ["000001.SZ"] * 5,
+            "trade_date": dates,
+            "close": [10.0, 10.2, 10.4, 10.6, 10.8],
+        }))
+
+        file_path = tmp_path / "daily" / "2025.parquet"
+        assert pq.ParquetFile(file_path).num_row_groups == 3
+
+        predicate = (ds.field("trade_date") >= "20250201") & (ds.field("trade_date") <= "20250228")
+        fragment = next(ds.dataset(file_path, format="parquet").get_fragments())
+        assert len(fragment.split_by_row_group(predicate)) == 1
+
+        loaded = storage.load_daily("2025", start_date="20250201", end_date="20250228")
+        assert loaded["trade_date"].tolist() == ["20250211", "20250212"]
+
+    def test_daily_appends_keep_one_row_group_per_month(self, tmp_path):
+        """测试逐日追加后仍是每月一个行组，日期条件只命中对应月份"""
+        storage = ParquetStorage(str(tmp_path))
+        storage.save_daily("2025", pd.DataFrame({
+            "ts_code": ["000001.SZ"], "trade_date": ["20250102"], "close": [10.0],
+        }))
+
+        days = ["20250103", "20250106", "20250203", "20250204", "20250303"]
+        for i, day in enumerate(days):
+            storage.append_daily("2025", pd.DataFrame({
+                "ts_code": ["000001.SZ", "600000.SH"],
+                "trade_date": [day, day],
+                "close": [10.0 + i, 8.0 + i],
+            }))
+
+        file_path = tmp_path / "daily" / "2025.parquet"
+        assert pq.ParquetFile(file_path).num_row_groups == 3
+        dates = pq.read_table(file_path)["trade_date"].to_pylist()
+        assert dates == sorted(dates)
+
+        predicate = (ds.field("trade_date") >= "20250201") & (ds.field("trade_date") <= "20250228")
+        fragment = next(ds.dataset(file_path, format="parquet").get_fragments())
+        assert len(fragment.split_by_row_group(predicate)) == 1
+
     def test_get_latest_trade_date(self, tmp_path):
         """测试获取最新交易日期"""
         storage = ParquetStorage(str(tmp_path))
@@ -0,0 +1,54 @@
+import threading
+import time
+
+import pytest
+
+from src.utils.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    def test_burst_passes_without_waiting(self):
+        """测试桶内令牌充足时不等待"""
+        bucket = TokenBucket(rate_per_sec=1, burst=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+
+    def test_token_bucket(self):
+        """测试连续请求被限制在设定速率内"""
+        bucket = TokenBucket(rate_per_sec=100, burst=1)
+
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # 首个令牌立即可用，其余10个各需 1/100 秒
+        assert elapsed >= 0.095
+
+    def test_shared_across_threads(self):
+        """测试多线程共享同一个桶时总速率不超限"""
+        bucket = TokenBucket(rate_per_sec=200, burst=1)
+
+        def worker():
+            for _ in range(5):
+                bucket.acquire()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+        elapsed = time.monotonic() - start
+
+        # 20个请求，首个立即放行，其余19个各需 1/200 秒
+        assert elapsed >= 0.09
+
+    def test_invalid_rate(self):
+        """测试非法参数"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_sec=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_sec=1, burst=0)
@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
 from unittest.mock import Mock, patch
+from src.data_collector.base_collector import CollectorError
 from src.data_collector.tushare_collector import TuShareCollector
 
 
@@ -102,3 +103,82 @@ class TestTuShareCollector:
         df = collector.get_money_flow("20250114")
 
         assert len(df) == 1
+
+    @pytest.mark.parametrize(
+        "message, expected",
+        [
+            ("抱歉，您每分钟最多访问该接口500次", 55.0),
+            ("抱歉，您每小时最多访问该接口10次", 2755.0),
+        ],
+        ids=["per_minute", "per_hour"],
+    )
+    @patch("src.data_collector.tushare_collector.time.time", return_value=1700000045.0)
+    @patch("src.utils.rate_limiter.time.sleep")
+    @patch("src.data_collector.base_collector.time.sleep")
+    @patch("src.data_collector.tushare_collector.ts")
+    def test_rate_limit_sets_retry_after(
+        self, mock_ts, mock_retry_sleep, mock_rate_sleep, mock_time, message, expected
+    ):
+        """测试频次超限报错转为 retry_after 为到下一个计数窗口剩余秒数的 CollectorError"""
+        mock_api = Mock()
+        mock_ts.pro_api.return_value = mock_api
+        mock_api.daily.side_effect = Exception(message)
+
+        collector = TuShareCollector("test_token")
+
+        with pytest.raises(CollectorError) as exc_info:
+            collector.get_daily_all("20250114")
+
+        # 1700000045 距下一个整分钟 55 秒，距下一个整点 2755 秒
+        assert exc_info.value.retry_after == pytest.approx(expected)
+
+    @patch("src.data_collector.tushare_collector.time.time", return_value=1700000045.0)
+    @patch("src.data_collector.collector_manager.time.sleep")
+    @patch("src.utils.rate_limiter.time.sleep")
+    @patch("src.data_collector.base_collector.time.sleep")
+    @patch("src.data_collector.tushare_collector.ts")
+    def test_manager_waits_out_minute_limit(
+        self, mock_ts, mock_retry_sleep, mock_rate_sleep, mock_manager_sleep, mock_time
+    ):
+        """测试放宽 max_retry_after 后按分钟限流时等待到下一个窗口再重试 TuShare"""
+        from src.data_collector.collector_manager import CollectorManager
+
+        mock_api = Mock()
+        mock_ts.pro_api.return_value = mock_api
+        limited = Exception("抱歉，您每分钟最多访问该接口500次")
+        mock_api.daily.side_effect = [limited] * 3 + [pd.DataFrame({
+            "ts_code": ["000001.SZ"], "trade_date": ["20250114"], "close": [10.2],
+        })]
+
+        manager = CollectorManager(primary=TuShareCollector("test_token"), max_retry_after=60.0)
+        df = manager.get_daily_all("20250114")
+
+        assert len(df) == 1
+        # time.sleep 为同一对象，除重试退避外应有一次等到下一个整分钟（55 秒加抖动）的等待
+        waits = [c.args[0] for c in mock_manager_sleep.call_args_list if 55.0 <= c.args[0] <= 55.25]
+        assert len(waits) == 1
+
+    @pytest.mark.parametrize("interval", [0, -1.0])
+    @patch("src.utils.rate_limiter.time.sleep")
+    @patch("src.data_collector.tushare_collector.ts")
+    def test_non_positive_interval_disables_rate_limit(self, mock_ts, mock_rate_sleep, interval):
+        """测试 request_interval <= 0 且未设置 rate_per_minute 时不限速"""
+        mock_api = Mock()
+        mock_ts.pro_api.return_value = mock_api
+        mock_api.daily.return_value = pd.DataFrame({
+            "ts_code": ["000001.SZ"], "trade_date": ["20250114"], "close": [10.2],
+        })
+
+        collector = TuShareCollector("test_token", request_interval=interval)
+        for _ in range(5):
+            collector.get_daily_all("20250114")
+
+        assert collector._limiter is None
+        mock_rate_sleep.assert_not_called()
+
+    @patch("src.data_collector.tushare_collector.ts")
+    def test_rate_per_minute_overrides_interval(self, mock_ts):
+        """测试设置 rate_per_minute 时即使 request_interval 为0也按其限速"""
+        collector = TuShareCollector("test_token", request_interval=0, rate_per_minute=120)
+
+        assert collector._limiter.rate_per_sec == 2